@@ -1,5 +1,148 @@
-from typing import List, Any, Optional, Dict, Union
+from typing import (List, Any, Optional, Dict, Union, Tuple, Deque, Callable,
+                    Iterator, BinaryIO)
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from heapq import merge
+import json
+import mmap
+import os
+import struct
+import time
+
+
+TimedRecord = Tuple[float, Any]
+
+
+class SegmentLog:
+    HEADER: struct.Struct = struct.Struct("<QI")
+
+    def __init__(self, directory: str, segment_bytes: int = 64 * 1024 * 1024,
+                 fsync_every: int = 64,
+                 max_segments: Optional[int] = None) -> None:
+        if segment_bytes < 1 or fsync_every < 1:
+            raise ValueError("Segment size and fsync interval must be >= 1")
+        if max_segments is not None and max_segments < 1:
+            raise ValueError("Segment retention must keep at least 1 segment")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync_every = fsync_every
+        self.max_segments = max_segments
+        self.segments: List[int] = sorted(
+            int(name[:-4]) for name in os.listdir(directory)
+            if name.endswith(".log") and name[:-4].isdigit())
+        self._index: Dict[int, array] = {}
+        for base in self.segments[:-1]:
+            self._index[base] = self._load_index(base)
+        if not self.segments:
+            self.segments.append(0)
+        active: int = self.segments[-1]
+        self._index[active] = self._scan(active)
+        self.next_offset: int = active + len(self._index[active])
+        self._file: BinaryIO = open(self._path(active, ".log"), "ab")
+        self._unsynced: int = 0
+
+    def append(self, batch: List[Any],
+               timestamps: Optional[List[float]] = None) -> int:
+        payload: bytes = json.dumps([timestamps, batch],
+                                    default=str).encode()
+        position: int = self._file.tell()
+        record_size: int = self.HEADER.size + len(payload)
+        if position > 0 and position + record_size > self.segment_bytes:
+            self._roll()
+            position = 0
+        offset: int = self.next_offset
+        self._file.write(self.HEADER.pack(offset, len(payload)))
+        self._file.write(payload)
+        self._index[self.segments[-1]].append(position)
+        self.next_offset += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+        return offset
+
+    def sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def read(self, from_offset: int = 0
+             ) -> Iterator[Tuple[int, List[float], List[Any]]]:
+        self._file.flush()
+        for number, base in enumerate(self.segments):
+            positions: array = self._index[base]
+            end: int = base + len(positions)
+            if end <= from_offset or not positions:
+                continue
+            if number == len(self.segments) - 1:
+                positions = array("Q", positions)
+            start: int = positions[max(from_offset - base, 0)]
+            with open(self._path(base, ".log"), "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                limit: int = len(mm)
+                while start < limit:
+                    offset, size = self.HEADER.unpack_from(mm, start)
+                    start += self.HEADER.size
+                    timestamps, batch = json.loads(mm[start:start + size])
+                    start += size
+                    yield offset, timestamps, batch
+
+    def close(self) -> None:
+        self.sync()
+        self._save_index(self.segments[-1])
+        self._file.close()
+
+    def _roll(self) -> None:
+        self.sync()
+        self._save_index(self.segments[-1])
+        self._file.close()
+        self.segments.append(self.next_offset)
+        self._index[self.next_offset] = array("Q")
+        self._file = open(self._path(self.next_offset, ".log"), "ab")
+        while self.max_segments is not None and \
+                len(self.segments) > self.max_segments:
+            oldest: int = self.segments.pop(0)
+            del self._index[oldest]
+            for suffix in (".log", ".index"):
+                try:
+                    os.remove(self._path(oldest, suffix))
+                except FileNotFoundError:
+                    pass
+
+    def _path(self, base: int, suffix: str) -> str:
+        return os.path.join(self.directory, f"{base:020d}{suffix}")
+
+    def _save_index(self, base: int) -> None:
+        with open(self._path(base, ".index"), "wb") as f:
+            self._index[base].tofile(f)
+
+    def _load_index(self, base: int) -> array:
+        positions: array = array("Q")
+        try:
+            with open(self._path(base, ".index"), "rb") as f:
+                positions.frombytes(f.read())
+            return positions
+        except (OSError, ValueError):
+            return self._scan(base)
+
+    def _scan(self, base: int) -> array:
+        positions: array = array("Q")
+        path: str = self._path(base, ".log")
+        if not os.path.exists(path):
+            return positions
+        with open(path, "r+b") as f:
+            data: bytes = f.read()
+            position: int = 0
+            while position + self.HEADER.size <= len(data):
+                _, size = self.HEADER.unpack_from(data, position)
+                if position + self.HEADER.size + size > len(data):
+                    break
+                positions.append(position)
+                position += self.HEADER.size + size
+            if position != len(data):
+                f.truncate(position)
+        return positions
 
 
 class DataStream(ABC):
@@ -7,11 +150,53 @@ class DataStream(ABC):
         super().__init__()
         self.data_type: str = "Generic"
         self.last_batch: List[Any] = []
+        self.last_timestamps: List[float] = []
+        self._pending_timestamps: Optional[List[float]] = None
+        self.segment_log: Optional[SegmentLog] = None
+        self._replaying: bool = False
 
     @abstractmethod
     def process_batch(self, data_batch: List[Any]) -> str:
         pass
 
+    def process_timed_batch(self, data_batch: List[Any],
+                            timestamps: Optional[List[float]] = None) -> str:
+        if timestamps is not None and len(timestamps) != len(data_batch):
+            raise ValueError("Timestamps do not match batch size")
+        self._pending_timestamps = timestamps
+        try:
+            return self.process_batch(data_batch)
+        finally:
+            self._pending_timestamps = None
+
+    def _accept_batch(self, data_batch: List[Any]) -> None:
+        self.last_batch = data_batch
+        if self._pending_timestamps is not None:
+            self.last_timestamps = self._pending_timestamps
+        else:
+            self.last_timestamps = [time.time()] * len(data_batch)
+        if self.segment_log is not None and not self._replaying:
+            self.segment_log.append(data_batch, self.last_timestamps)
+
+    def attach_log(self, segment_log: Optional[SegmentLog]) -> None:
+        self.segment_log = segment_log
+
+    def replay(self, from_offset: int = 0) -> int:
+        if self.segment_log is None:
+            raise ValueError("Stream has no segment log attached")
+        replayed: int = 0
+        self._replaying = True
+        try:
+            for _, timestamps, batch in self.segment_log.read(from_offset):
+                self.process_timed_batch(batch, timestamps)
+                replayed += 1
+        finally:
+            self._replaying = False
+        return replayed
+
+    def timed_records(self) -> List[TimedRecord]:
+        return list(zip(self.last_timestamps, self.last_batch))
+
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
         if criteria is None:
@@ -51,7 +236,7 @@ class SensorStream(DataStream):
                 return f"Not existed sensor name '{el}'"
             if name_value[1] == "":
                 return f"Value is empty: '{el}'"
-        self.last_batch = data_batch
+        self._accept_batch(data_batch)
         return f"Processing sensor batch: [{', '.join(data_batch)}]"
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
@@ -95,7 +280,7 @@ class TransactionStream(DataStream):
                 return f"Not existed operation '{el}'"
             if name_value[1] == "":
                 return f"Value is empty: '{el}'"
-        self.last_batch = data_batch
+        self._accept_batch(data_batch)
         return f"Processing transaction batch: [{', '.join(data_batch)}]"
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
@@ -128,7 +313,7 @@ class EventStream(DataStream):
         for el in data_batch:
             if isinstance(el, str) is False:
                 return f"Unknown event data received: '{el}'"
-        self.last_batch = data_batch
+        self._accept_batch(data_batch)
         return f"Processing event batch: [{', '.join(data_batch)}]"
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
@@ -141,6 +326,78 @@ class EventStream(DataStream):
         return stream_data
 
 
+def _timestamp(item: Tuple[float, int, Any]) -> float:
+    return item[0]
+
+
+class WindowedJoin:
+    def __init__(self, window: float,
+                 left_filter: Optional[Callable[[Any], bool]] = None,
+                 right_filter: Optional[Callable[[Any], bool]] = None) -> None:
+        if window < 0:
+            raise ValueError("Join window must be >= 0")
+        self.window = window
+        self.left_filter = left_filter
+        self.right_filter = right_filter
+        self.late_records: int = 0
+        # Each side tracks its own event time, so one side running ahead
+        # does not make the other side's records look late.
+        self.watermarks: List[float] = [float("-inf"), float("-inf")]
+        self._left: Deque[TimedRecord] = deque()
+        self._right: Deque[TimedRecord] = deque()
+
+    def push(self, left: List[TimedRecord],
+             right: List[TimedRecord]) -> List[Tuple[TimedRecord,
+                                                     TimedRecord]]:
+        matches: List[Tuple[TimedRecord, TimedRecord]] = []
+        tagged_left = ((ts, 0, rec) for ts, rec in left
+                       if self.left_filter is None or self.left_filter(rec))
+        tagged_right = ((ts, 1, rec) for ts, rec in right
+                        if self.right_filter is None or
+                        self.right_filter(rec))
+        # Batches may arrive out of order; merge needs each side sorted.
+        for ts, side, rec in merge(sorted(tagged_left, key=_timestamp),
+                                   sorted(tagged_right, key=_timestamp),
+                                   key=_timestamp):
+            if ts < self.watermarks[side]:
+                self.late_records += 1
+                continue
+            self.watermarks[side] = ts
+            self._evict(self.watermark - self.window)
+            if side == 0:
+                matches.extend(((ts, rec), other)
+                               for other in self._in_window(self._right, ts))
+                self._left.append((ts, rec))
+            else:
+                matches.extend((other, (ts, rec))
+                               for other in self._in_window(self._left, ts))
+                self._right.append((ts, rec))
+        return matches
+
+    @property
+    def watermark(self) -> float:
+        return min(self.watermarks)
+
+    def join(self, left_stream: DataStream,
+             right_stream: DataStream) -> List[Tuple[TimedRecord,
+                                                     TimedRecord]]:
+        return self.push(left_stream.timed_records(),
+                         right_stream.timed_records())
+
+    def buffered(self) -> int:
+        return len(self._left) + len(self._right)
+
+    def _in_window(self, buffer: Deque[TimedRecord],
+                   ts: float) -> List[TimedRecord]:
+        return [other for other in buffer
+                if abs(other[0] - ts) <= self.window]
+
+    def _evict(self, oldest: float) -> None:
+        for buffer in (self._left, self._right):
+            while buffer and buffer[0][0] < oldest:
+                buffer.popleft()
+
+
 class StreamProcessor():
     def __init__(self) -> None:
         self.batch_number = 1
@@ -0,0 +1,257 @@
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from array import array
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from nexus_pipeline import (ProcessingPipeline, InputStage, TransformStage,
+                            OutputStage, JSONAdapter, CSVAdapter,
+                            StreamAdapter, NexusManager, tracer, OFF)
+
+
+ADAPTERS: Dict[str, Callable[[str], ProcessingPipeline]] = {
+    "JSONAdapter": JSONAdapter,
+    "CSVAdapter": CSVAdapter,
+    "StreamAdapter": StreamAdapter,
+}
+
+
+def make_json(size: int) -> str:
+    fields: List[str] = ['"sensor": "temp"', '"value": 23.5', '"unit": "C"']
+    fields.extend(f'"extra_{i}": "{i}"' for i in range(max(size - 3, 0)))
+    return "{" + ", ".join(fields) + "}"
+
+
+def make_csv(size: int) -> str:
+    rows: List[str] = [f"user_{i},login,05.02.2026" for i in range(size)]
+    return "user,action,timestamp\n" + "\n".join(rows)
+
+
+def make_stream(size: int) -> List[float]:
+    return [20.0 + (i % 100) / 10 for i in range(size)]
+
+
+def make_stream_array(size: int) -> array:
+    return array("d", make_stream(size))
+
+
+PAYLOADS: Dict[str, Callable[[int], Any]] = {
+    "JSON": make_json,
+    "CSV": make_csv,
+    "stream": make_stream,
+    "stream-array": make_stream_array,
+}
+
+
+class BenchmarkResult:
+    def __init__(self, name: str, records: int,
+                 trials: List[List[float]]) -> None:
+        self.name = name
+        self.records = records
+        self.trials = len(trials)
+        rates: List[float] = []
+        p50s: List[float] = []
+        p95s: List[float] = []
+        p99s: List[float] = []
+        for latencies in trials:
+            total: float = sum(latencies)
+            ordered: List[float] = sorted(latencies)
+            rates.append(len(latencies) / total if total else 0.0)
+            p50s.append(percentile(ordered, 50))
+            p95s.append(percentile(ordered, 95))
+            p99s.append(percentile(ordered, 99))
+        self.records_per_sec: float = max(rates)
+        self.p50: float = min(p50s)
+        self.p95: float = statistics.median(p95s)
+        self.p99: float = statistics.median(p99s)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"records": self.records,
+                "trials": self.trials,
+                "records_per_sec": self.records_per_sec,
+                "p50_us": self.p50 * 1e6,
+                "p95_us": self.p95 * 1e6,
+                "p99_us": self.p99 * 1e6}
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index: int = min(len(ordered) - 1,
+                     max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(func: Callable[[Any], Any], payload: Any,
+            records: int) -> List[float]:
+    latencies: List[float] = []
+    clock: Callable[[], float] = time.perf_counter
+    for _ in range(records):
+        start: float = clock()
+        func(payload)
+        latencies.append(clock() - start)
+    return latencies
+
+
+def calibrate(rounds: int = 3) -> float:
+    best: float = float("inf")
+    for _ in range(rounds):
+        start: float = time.perf_counter()
+        for i in range(2000):
+            fields: List[str] = f"user_{i},login,05.02.2026".split(",")
+            record: Dict[str, str] = {"user": fields[0], "action": fields[1]}
+            sum(float(len(value)) for value in record.values())
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def build_adapter(adapter: str) -> ProcessingPipeline:
+    pipeline: ProcessingPipeline = ADAPTERS[adapter]("bench")
+    pipeline.add_stage(InputStage())
+    pipeline.add_stage(TransformStage())
+    pipeline.add_stage(OutputStage())
+    return pipeline
+
+
+def build_chain() -> NexusManager:
+    manager: NexusManager = NexusManager()
+    for adapter, stage in (("CSVAdapter", InputStage()),
+                           ("JSONAdapter", TransformStage()),
+                           ("StreamAdapter", OutputStage())):
+        pipeline: ProcessingPipeline = ADAPTERS[adapter](adapter)
+        pipeline.add_stage(stage)
+        manager.add_pipeline(pipeline)
+    return manager
+
+
+def run_suite(sizes: List[int], records: int, warmup: int,
+              trials: int) -> Tuple[Dict[str, BenchmarkResult], float]:
+    cases: List[Tuple[str, Callable[[Any], Any], Any]] = []
+    for size in sizes:
+        for format, make in PAYLOADS.items():
+            payload: Any = make(size)
+            for adapter in ADAPTERS:
+                cases.append((f"{adapter}/{format}/{size}",
+                              build_adapter(adapter).process, payload))
+            cases.append((f"NexusManager/{format}/{size}",
+                          build_chain().process_data, payload))
+    for _, func, payload in cases:
+        for _ in range(warmup):
+            func(payload)
+    runs: Dict[str, List[List[float]]] = {name: [] for name, _, _ in cases}
+    order: random.Random = random.Random(0)
+    calibration: float = float("inf")
+    for _ in range(trials):
+        calibration = min(calibration, calibrate())
+        order.shuffle(cases)
+        for name, func, payload in cases:
+            runs[name].append(measure(func, payload, records))
+    return ({name: BenchmarkResult(name, records, latencies)
+             for name, latencies in runs.items()}, calibration)
+
+
+def save_baseline(path: str, results: Dict[str, BenchmarkResult],
+                  calibration: float) -> None:
+    document: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.time(),
+        "calibration_us": calibration * 1e6,
+        "results": {name: result.to_dict()
+                    for name, result in results.items()},
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+
+
+def find_regressions(path: str, results: Dict[str, BenchmarkResult],
+                     threshold: float,
+                     calibration: float) -> List[Tuple[str, str]]:
+    with open(path, "r") as f:
+        document: Dict[str, Any] = json.load(f)
+    baseline: Dict[str, Any] = document["results"]
+    # Scale by the reference loop so a machine-wide slowdown since the
+    # baseline was recorded is not reported as a regression.
+    speed: float = calibration * 1e6 / document.get(
+        "calibration_us", calibration * 1e6)
+    regressions: List[Tuple[str, str]] = []
+    for name, result in results.items():
+        previous: Optional[Dict[str, float]] = baseline.get(name)
+        if previous is None:
+            continue
+        rate: float = result.records_per_sec * speed
+        p50: float = result.p50 * 1e6 / speed
+        if rate < previous["records_per_sec"] * (1 - threshold):
+            regressions.append((name, (
+                f"throughput {rate:.0f} rec/s < "
+                f"baseline {previous['records_per_sec']:.0f} rec/s")))
+        if p50 > previous["p50_us"] * (1 + threshold):
+            regressions.append((name, (
+                f"p50 {p50:.1f}us > "
+                f"baseline {previous['p50_us']:.1f}us")))
+    return regressions
+
+
+def print_report(results: Dict[str, BenchmarkResult]) -> None:
+    print(f"{'benchmark':<36} {'rec/s':>12} {'p50 us':>10} "
+          f"{'p95 us':>10} {'p99 us':>10}")
+    for name, result in results.items():
+        print(f"{name:<36} {result.records_per_sec:>12.0f} "
+              f"{result.p50 * 1e6:>10.1f} {result.p95 * 1e6:>10.1f} "
+              f"{result.p99 * 1e6:>10.1f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Code Nexus pipeline system.")
+    parser.add_argument("--records", type=int, default=500,
+                        help="measured records per benchmark")
+    parser.add_argument("--warmup", type=int, default=200,
+                        help="unmeasured warmup records per benchmark")
+    parser.add_argument("--trials", type=int, default=15,
+                        help="measured runs per benchmark, interleaved "
+                             "across the suite; the best run is compared")
+    parser.add_argument("--sizes", default="1,10,100",
+                        help="comma separated payload sizes")
+    parser.add_argument("--save", metavar="PATH",
+                        help="write results as a JSON baseline")
+    parser.add_argument("--baseline", metavar="PATH",
+                        help="compare results against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.35,
+                        help="allowed relative slowdown (default 0.35)")
+    args = parser.parse_args(argv)
+
+    if args.records < 1 or args.trials < 1:
+        parser.error("--records and --trials must be >= 1")
+    sizes: List[int] = [int(size) for size in args.sizes.split(",")]
+    level: int = tracer.level
+    tracer.set_level(OFF)
+    try:
+        results, calibration = run_suite(
+            sizes, args.records, args.warmup, args.trials)
+    finally:
+        tracer.set_level(level)
+    print_report(results)
+
+    if args.save:
+        save_baseline(args.save, results, calibration)
+        print(f"\nBaseline saved to {args.save}")
+    if args.baseline:
+        regressions: List[Tuple[str, str]] = find_regressions(
+            args.baseline, results, args.threshold, calibration)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond "
+                  f"{args.threshold:.0%}:")
+            for name, reason in regressions:
+                print(f"- {name}: {reason}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,31 @@
-from typing import List, Dict, Union, Any, Protocol
+from typing import (List, Dict, Union, Any, Protocol, Iterable, Optional,
+                    Tuple, Deque, Callable, Awaitable, TextIO, Set,
+                    Iterator, Type)
 from abc import ABC, abstractmethod
+from array import array
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from itertools import compress, islice, repeat
+from multiprocessing import shared_memory
+import asyncio
+import atexit
+import copy
+import cProfile
+import hashlib
+import inspect
+import io
+import multiprocessing
+import os
+import pickle
+import pstats
+import random
+import struct
+import sys
+import threading
 import time
+import tracemalloc
+import weakref
 
 
 class ProcessingStage(Protocol):
@@ -8,140 +33,1489 @@ class ProcessingStage(Protocol):
         ...
 
 
+class BatchProcessingStage(Protocol):
+    def process(self, data: Any) -> Any:
+        ...
+
+    def process_many(self, data: List[Any]) -> List[Any]:
+        ...
+
+
+class AsyncProcessingStage(Protocol):
+    async def process(self, data: Any) -> Any:
+        ...
+
+
+DEBUG: int = 10
+INFO: int = 20
+WARNING: int = 30
+ERROR: int = 40
+OFF: int = 100
+
+
+class Tracer:
+    def __init__(self, level: int = INFO, stream: Optional[TextIO] = None,
+                 buffer_size: int = 512,
+                 flush_interval: float = 0.05) -> None:
+        self.level = level
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._closed: bool = False
+        self._thread: Optional[threading.Thread] = None
+        self._reset_locks()
+        _tracers.add(self)
+
+    def _reset_locks(self) -> None:
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def _after_fork(self) -> None:
+        self._reset_locks()
+        self._buffer = []
+
+    def set_level(self, level: int) -> None:
+        self.level = level
+
+    def emit(self, level: int, message: str) -> None:
+        if level < self.level:
+            return
+        with self._lock:
+            self._buffer.append(message)
+            pending: int = len(self._buffer)
+        if self._closed or pending >= self.buffer_size * 8:
+            self.flush()
+            return
+        if self._thread is None:
+            self._start()
+        if pending >= self.buffer_size:
+            self._wakeup.set()
+
+    def debug(self, message: str) -> None:
+        self.emit(DEBUG, message)
+
+    def info(self, message: str) -> None:
+        self.emit(INFO, message)
+
+    def warning(self, message: str) -> None:
+        self.emit(WARNING, message)
+
+    def error(self, message: str) -> None:
+        self.emit(ERROR, message)
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                pending, self._buffer = self._buffer, []
+            if pending:
+                stream: TextIO = self.stream or sys.stdout
+                stream.write("\n".join(pending) + "\n")
+                stream.flush()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run,
+                                            name="nexus-tracer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+_tracers: "weakref.WeakSet[Tracer]" = weakref.WeakSet()
+
+
+def _close_tracers() -> None:
+    for active in list(_tracers):
+        active.close()
+
+
+def _reset_tracers() -> None:
+    for active in list(_tracers):
+        active._after_fork()
+
+
+atexit.register(_close_tracers)
+os.register_at_fork(after_in_child=_reset_tracers)
+
+
+tracer: Tracer = Tracer()
+
+
+def detect_format(data: Any) -> Optional[str]:
+    if isinstance(data, str):
+        if data.startswith("{"):
+            return "JSON"
+        if "," in data:
+            return "CSV"
+    elif _is_numeric_buffer(data):
+        return "stream"
+    elif isinstance(data, list) and all(isinstance(item, float)
+                                        for item in data):
+        return "stream"
+    elif isinstance(data, (list, tuple)) and len(data) > 0 and \
+            all(_is_numeric_buffer(chunk) for chunk in data):
+        return "stream"
+    elif isinstance(data, Iterator):
+        return "stream"
+    return None
+
+
+NUMERIC_TYPECODES: str = "bBhHiIlLqQfd"
+
+
+def _is_numeric_buffer(data: Any) -> bool:
+    if isinstance(data, array):
+        return data.typecode in NUMERIC_TYPECODES
+    if isinstance(data, memoryview):
+        return data.ndim == 1 and data.format in NUMERIC_TYPECODES
+    return False
+
+
+class StreamAggregate:
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def update(self, chunk: Any) -> None:
+        size: int = len(chunk)
+        if size == 0:
+            return
+        self.count += size
+        self.total += sum(chunk)
+        low, high = min(chunk), max(chunk)
+        if self.minimum is None or low < self.minimum:
+            self.minimum = low
+        if self.maximum is None or high > self.maximum:
+            self.maximum = high
+
+    @property
+    def mean(self) -> float:
+        return 0 if self.count == 0 else self.total / self.count
+
+
+def stream_chunks(values: Any,
+                  chunk_size: int = 65536) -> Iterator[Any]:
+    if _is_numeric_buffer(values):
+        yield values
+        return
+    if isinstance(values, (list, tuple)):
+        if len(values) > 0 and _is_numeric_buffer(values[0]):
+            yield from values
+        else:
+            yield values
+        return
+    pending: array = array("d")
+    for item in values:
+        if isinstance(item, (int, float)):
+            pending.append(item)
+            if len(pending) >= chunk_size:
+                yield pending
+                pending = array("d")
+        elif _is_numeric_buffer(item):
+            yield item
+        else:
+            raise ValueError(f"stream: non-numeric value {item!r}")
+    if pending:
+        yield pending
+
+
+class ColumnarTable:
+    def __init__(self, columns: Dict[str, Any]) -> None:
+        self.columns = columns
+        self.size: int = len(next(iter(columns.values()), []))
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_rows(cls: Type["ColumnarTable"], header: List[str],
+                  rows: List[str]) -> "ColumnarTable":
+        names: List[str] = [sys.intern(name.strip()) for name in header]
+        width: int = len(names)
+        widths: Set[int] = set(map(str.count, rows, repeat(",")))
+        if widths - {width - 1}:
+            raise ValueError(f"ColumnarTable: rows must have {width} fields")
+        cells: List[str] = ",".join(rows).split(",") if rows else []
+        return cls({name: _typed_column(cells[index::width])
+                    for index, name in enumerate(names)})
+
+    def column(self, name: str) -> Any:
+        if name not in self.columns:
+            raise ValueError(f"ColumnarTable: unknown column '{name}'")
+        return self.columns[name]
+
+    def where(self, name: str,
+              predicate: Callable[[Any], bool]) -> "ColumnarTable":
+        mask: List[bool] = list(map(predicate, self.column(name)))
+        return ColumnarTable({key: _compress_column(column, mask)
+                              for key, column in self.columns.items()})
+
+    def where_equals(self, name: str, value: Any) -> "ColumnarTable":
+        return self.where(name, lambda cell: cell == value)
+
+    def group_count(self, key: str) -> Dict[Any, int]:
+        return dict(Counter(self.column(key)))
+
+    def group_sum(self, key: str, value: str) -> Dict[Any, float]:
+        values: Any = self.column(value)
+        if not isinstance(values, array):
+            raise ValueError(f"ColumnarTable: column '{value}' "
+                             f"is not numeric")
+        totals: Dict[Any, float] = defaultdict(float)
+        for group, amount in zip(self.column(key), values):
+            totals[group] += amount
+        return dict(totals)
+
+
+def _typed_column(cells: List[str]) -> Any:
+    try:
+        return array("q", map(int, cells))
+    except (ValueError, OverflowError):
+        pass
+    try:
+        return array("d", map(float, cells))
+    except ValueError:
+        pass
+    return list(map(sys.intern, map(str.strip, cells)))
+
+
+def _compress_column(column: Any, mask: List[bool]) -> Any:
+    if isinstance(column, array):
+        return array(column.typecode, compress(column, mask))
+    return list(compress(column, mask))
+
+
+class StageError(ValueError):
+    def __init__(self, stage: Any, partial: Any, error: Exception) -> None:
+        super().__init__(str(error))
+        self.stage = stage
+        self.partial = partial
+        self.error = error
+
+
 class InputStage:
     def process(self, data: Any) -> Dict[str, Any]:
-        print(f"Input: '{data}'")
-        res: Dict[str, Any] = {}
-        if isinstance(data, str) and data.startswith("{"):
-            data = data.strip("{}")
-            readings: List[str] = data.split(",")
-            if len(readings) == 0:
-                raise ValueError("InputStage: Empty json data")
-            for reading in readings:
-                key_value: List[str] = reading.split(":")
-                if len(key_value) != 2:
-                    raise ValueError(f"InputStage: not correct json format - "
-                                     f"{reading}")
-                key = key_value[0].strip().strip('"')
-                value = key_value[1].strip().strip('"')
-                res[key] = value
-            res["format"] = "JSON"
-            return res
-        elif isinstance(data, str) and "," in data:
-            lines = [line.strip() for line in data.splitlines()
-                     if line.strip()]
-            if len(lines) == 0:
-                raise ValueError("Input stage: Empty csv data")
-            header = lines[0].split(",")
-            rows = lines[1:]
-            res["format"] = "CSV"
-            res["columns"] = header
-            res["rows"] = rows
-            return res
-        elif isinstance(data, list) and all(isinstance(item, float)
-                                            for item in data):
-            res.update({"values": data})
-            res["format"] = "stream"
-            return res
+        if tracer.level <= INFO:
+            tracer.emit(INFO, f"Input: '{data}'")
+        format = detect_format(data)
+        if format == "JSON":
+            return self._parse_json(data)
+        elif format == "CSV":
+            return self._parse_csv(data)
+        elif format == "stream":
+            return self._parse_stream(data)
         raise ValueError("Input Stage: Unknown data format")
 
+    def process_many(self, data: List[Any]) -> List[Dict[str, Any]]:
+        parsers: Dict[Optional[str], Callable[[Any], Dict[str, Any]]] = {
+            "JSON": self._parse_json,
+            "CSV": self._parse_csv,
+            "stream": self._parse_stream,
+        }
+        results: List[Dict[str, Any]] = []
+        for record in data:
+            parser = parsers.get(detect_format(record))
+            if parser is None:
+                raise ValueError("Input Stage: Unknown data format")
+            results.append(parser(record))
+        if tracer.level <= INFO:
+            tracer.emit(INFO, f"Input: {len(results)} records parsed")
+        return results
+
+    def _parse_json(self, data: str) -> Dict[str, Any]:
+        res: Dict[str, Any] = {}
+        data = data.strip("{}")
+        readings: List[str] = data.split(",")
+        if len(readings) == 0:
+            raise ValueError("InputStage: Empty json data")
+        for reading in readings:
+            key_value: List[str] = reading.split(":")
+            if len(key_value) != 2:
+                raise ValueError(f"InputStage: not correct json format - "
+                                 f"{reading}")
+            key = key_value[0].strip().strip('"')
+            value = key_value[1].strip().strip('"')
+            res[key] = value
+        res["format"] = "JSON"
+        return res
+
+    def _parse_csv(self, data: str) -> Dict[str, Any]:
+        res: Dict[str, Any] = {}
+        lines = [line.strip() for line in data.splitlines()
+                 if line.strip()]
+        if len(lines) == 0:
+            raise ValueError("Input stage: Empty csv data")
+        header = lines[0].split(",")
+        rows = lines[1:]
+        res["format"] = "CSV"
+        res["columns"] = header
+        res["rows"] = rows
+        return res
+
+    def _parse_stream(self, data: Any) -> Dict[str, Any]:
+        res: Dict[str, Any] = {}
+        res.update({"values": data})
+        res["format"] = "stream"
+        return res
+
 
 class TransformStage:
+    messages: Dict[str, str] = {
+        "JSON": "Transform: Enriched with metadata and validation",
+        "CSV": "Transform: Parsed and structured data",
+        "stream": "Transform: Aggregated and filtered",
+    }
+
+    def __init__(self, columnar: bool = False) -> None:
+        self.columnar = columnar
+
     def process(self, data: Any) -> Dict:
+        data = self._prepare(data)
+        format = data["format"]
+        if format == "JSON":
+            data = self._transform_json(data)
+        elif format == "CSV":
+            data = self._transform_csv(data)
+        elif format == "stream":
+            data = self._transform_stream(data)
+        else:
+            return data
+        if tracer.level <= INFO:
+            tracer.emit(INFO, self.messages[format])
+        return data
+
+    def process_many(self, data: List[Any]) -> List[Dict]:
+        transforms: Dict[str, Callable[[Dict], Dict]] = {
+            "JSON": self._transform_json,
+            "CSV": self._transform_csv,
+            "stream": self._transform_stream,
+        }
+        prepare = self._prepare
+        results: List[Dict] = []
+        for record in data:
+            record = prepare(record)
+            transform = transforms.get(record["format"])
+            results.append(record if transform is None
+                           else transform(record))
+        if tracer.level <= INFO:
+            tracer.emit(INFO,
+                        f"Transform: {len(results)} records transformed")
+        return results
+
+    def _prepare(self, data: Any) -> Dict:
         if isinstance(data, dict) is False:
             raise ValueError(f"TransformStage: data is not dict - {data}")
-        data: Dict = dict(data)
+        data = dict(data)
         if data.get("format", False) is False:
             raise ValueError(("TransformStage: data does not contain 'format' "
                               "key"))
-        format = data["format"]
-        if format == "JSON":
-            if data.get("value", False) is False:
-                raise ValueError(("TransformStage: data does not contain "
-                                  "'value' key"))
-            data["value"] = float(data["value"])
-            print("Transform: Enriched with metadata and validation")
-        elif format == "CSV":
-            if data.get("rows", False) is False:
-                raise ValueError(("TransformStage: data does not contain "
-                                  "'rows' key"))
-            data["rows"] = len(data["rows"])
-            print("Transform: Parsed and structured data")
-        elif format == "stream":
-            if data.get("values", False) is False:
-                raise ValueError(("TransformStage: data does not contain "
-                                  "'values' key"))
-            data["readings"] = len(data["values"])
-            data["avg"] = 0 if data["readings"] == 0 else round(
-                sum(data["values"]) / data["readings"], 1)
-            print("Transform: Aggregated and filtered")
         return data
 
+    def _transform_json(self, data: Dict) -> Dict:
+        if data.get("value", False) is False:
+            raise ValueError(("TransformStage: data does not contain "
+                              "'value' key"))
+        data["value"] = float(data["value"])
+        return data
+
+    def _transform_csv(self, data: Dict) -> Dict:
+        if data.get("rows", False) is False:
+            raise ValueError(("TransformStage: data does not contain "
+                              "'rows' key"))
+        if self.columnar:
+            data["table"] = ColumnarTable.from_rows(data["columns"],
+                                                    data["rows"])
+        data["rows"] = len(data["rows"])
+        return data
+
+    def _transform_stream(self, data: Dict) -> Dict:
+        if data.get("values", False) is False:
+            raise ValueError(("TransformStage: data does not contain "
+                              "'values' key"))
+        aggregate: StreamAggregate = StreamAggregate()
+        for chunk in stream_chunks(data["values"]):
+            aggregate.update(chunk)
+        data["readings"] = aggregate.count
+        data["avg"] = 0 if aggregate.count == 0 else round(aggregate.mean, 1)
+        data["min"] = aggregate.minimum
+        data["max"] = aggregate.maximum
+        return data
+
+
+class OutputSink(ABC):
+    def __init__(self, buffer_bytes: int = 1 << 20,
+                 flush_interval: Optional[float] = 1.0) -> None:
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.closed: bool = False
+        self._buffer: List[str] = []
+        self._buffered: int = 0
+        self._timer: Optional[threading.Timer] = None
+        self._reset_locks()
+        _open_sinks.add(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # A copy in another process would write the same destination
+        # behind this sink's back; workers hand lines back instead.
+        raise TypeError(f"{self.__class__.__name__} cannot be pickled; "
+                        f"worker output is delivered by the parent")
+
+    def __del__(self) -> None:
+        if not getattr(self, "closed", True):
+            self.close()
+
+    def _reset_locks(self) -> None:
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def _after_fork(self) -> None:
+        self._reset_locks()
+        self._buffer = []
+        self._buffered = 0
+
+    def write(self, result: str) -> None:
+        self.write_many([result])
+
+    def write_many(self, results: List[str]) -> None:
+        with self._lock:
+            if self.closed:
+                raise ValueError("OutputSink: sink is closed")
+            self._buffer.extend(results)
+            self._buffered += sum(map(len, results)) + len(results)
+            if self._buffered >= self.buffer_bytes:
+                self._flush_locked()
+            elif self._timer is None and self.flush_interval is not None:
+                self._timer = threading.Timer(self.flush_interval,
+                                              self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self.closed:
+                return
+            self._flush_locked()
+            self.closed = True
+            self._close()
+        _open_sinks.discard(self)
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer:
+            lines, self._buffer = self._buffer, []
+            self._buffered = 0
+            self._write_lines(lines)
+
+    @abstractmethod
+    def _write_lines(self, lines: List[str]) -> None:
+        pass
+
+    def _close(self) -> None:
+        pass
+
+
+class MemorySink(OutputSink):
+    def __init__(self, buffer_bytes: int = 1 << 20,
+                 flush_interval: Optional[float] = None) -> None:
+        super().__init__(buffer_bytes, flush_interval)
+        self.results: List[str] = []
+        self.writes: int = 0
+
+    def _write_lines(self, lines: List[str]) -> None:
+        self.results.extend(lines)
+        self.writes += 1
+
+
+class FileSink(OutputSink):
+    def __init__(self, path: str, buffer_bytes: int = 1 << 20,
+                 flush_interval: Optional[float] = 1.0) -> None:
+        self.path = path
+        self._file: TextIO = open(path, "a", encoding="utf-8")
+        super().__init__(buffer_bytes, flush_interval)
+
+    def _write_lines(self, lines: List[str]) -> None:
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class RotatingFileSink(FileSink):
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024,
+                 backup_count: int = 5, buffer_bytes: int = 1 << 20,
+                 flush_interval: Optional[float] = 1.0) -> None:
+        if max_bytes < 1 or backup_count < 0:
+            raise ValueError("RotatingFileSink: max_bytes must be >= 1 and "
+                             "backup_count >= 0")
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        super().__init__(path, buffer_bytes, flush_interval)
+
+    def _write_lines(self, lines: List[str]) -> None:
+        chunk: str = "\n".join(lines) + "\n"
+        size: int = len(chunk.encode("utf-8"))
+        if self._file.tell() > 0 and \
+                self._file.tell() + size > self.max_bytes:
+            self._rotate()
+        self._file.write(chunk)
+        self._file.flush()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self.backup_count == 0:
+            os.remove(self.path)
+        else:
+            for number in range(self.backup_count - 1, 0, -1):
+                source: str = f"{self.path}.{number}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{number + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        self._file = open(self.path, "a", encoding="utf-8")
+
+
+# Stands in for a real sink inside a worker; the parent writes its lines.
+class _CapturedSink(OutputSink):
+    def __init__(self) -> None:
+        super().__init__(flush_interval=None)
+        self.lines: List[str] = []
+
+    def __reduce__(self) -> Tuple[type, Tuple[()]]:
+        return _CapturedSink, ()
+
+    def _write_lines(self, lines: List[str]) -> None:
+        self.lines.extend(lines)
+
+    def drain(self) -> List[str]:
+        self.flush()
+        lines, self.lines = self.lines, []
+        return lines
+
+
+def _without_sink(stage: Any) -> Any:
+    if getattr(stage, "sink", None) is None or \
+            isinstance(stage.sink, _CapturedSink):
+        return stage
+    detached: Any = copy.copy(stage)
+    detached.sink = _CapturedSink()
+    return detached
+
+
+_open_sinks: "weakref.WeakSet[OutputSink]" = weakref.WeakSet()
+
+
+def _close_open_sinks() -> None:
+    for sink in list(_open_sinks):
+        sink.close()
+
+
+def _flush_open_sinks() -> None:
+    for sink in list(_open_sinks):
+        sink.flush()
+
+
+def _reset_open_sinks() -> None:
+    for sink in list(_open_sinks):
+        sink._after_fork()
+
+
+atexit.register(_close_open_sinks)
+os.register_at_fork(after_in_child=_reset_open_sinks)
+
 
 class OutputStage:
+    cacheable: bool = False
+
+    def __init__(self, sink: Optional["OutputSink"] = None) -> None:
+        self.sink = sink
+
     def process(self, data: Any) -> str:
         result: str
         try:
             format = data["format"]
             if format == "JSON":
-                temp = data["value"]
-                range_info = ("(Normal range)"
-                              if temp < 30
-                              else "(Out of range)")
-                result = (f"Output: Processed temperature reading: "
-                          f"{data["value"]}°C {range_info}")
+                result = self._render_json(data)
             elif format == "CSV":
-                result = (f"Output: User activity logged: "
-                          f"{data["rows"]} actions processed")
+                result = self._render_csv(data)
             elif format == "stream":
-                result = (f"Output: Stream summary: {data["readings"]} "
-                          f"readings, avg: {data["avg"]}°C")
+                result = self._render_stream(data)
             else:
                 raise ValueError("OutputStage: Unknown format")
-            print(result)
-            return result
         except Exception:
             raise ValueError(f"OutputStage: data is not correct: {data}")
+        self._deliver(result)
+        return result
+
+    def _deliver(self, result: str) -> None:
+        if self.sink is not None:
+            self.sink.write(result)
+        elif tracer.level <= INFO:
+            tracer.emit(INFO, result)
+
+    def process_many(self, data: List[Any]) -> List[str]:
+        renders: Dict[str, Callable[[Any], str]] = {
+            "JSON": self._render_json,
+            "CSV": self._render_csv,
+            "stream": self._render_stream,
+        }
+        results: List[str] = []
+        for record in data:
+            try:
+                results.append(renders[record["format"]](record))
+            except Exception:
+                raise ValueError(f"OutputStage: data is not correct: "
+                                 f"{record}")
+        if results:
+            if self.sink is not None:
+                self.sink.write_many(results)
+            elif tracer.level <= INFO:
+                tracer.emit(INFO, "\n".join(results))
+        return results
+
+    def _render_json(self, data: Any) -> str:
+        temp = data["value"]
+        range_info = ("(Normal range)"
+                      if temp < 30
+                      else "(Out of range)")
+        return (f"Output: Processed temperature reading: "
+                f"{data["value"]}°C {range_info}")
+
+    def _render_csv(self, data: Any) -> str:
+        return (f"Output: User activity logged: "
+                f"{data["rows"]} actions processed")
+
+    def _render_stream(self, data: Any) -> str:
+        return (f"Output: Stream summary: {data["readings"]} "
+                f"readings, avg: {data["avg"]}°C")
+
+
+def content_key(data: Any) -> Optional[str]:
+    raw: bytes
+    if isinstance(data, array):
+        raw = f"array:{data.typecode}:".encode() + data.tobytes()
+    elif isinstance(data, (str, bytes, list, tuple, dict, int, float)):
+        raw = f"{type(data).__name__}:{data!r}".encode()
+    else:
+        return None
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, max_size: int = 1024,
+                 ttl: Optional[float] = None) -> None:
+        if max_size < 1:
+            raise ValueError("ResultCache: max_size must be >= 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        entry: Optional[Tuple[float, Any]] = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        if self.ttl is not None and \
+                time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Hand out a copy so a caller mutating its result cannot change
+        # what later hits see.
+        return True, copy.copy(entry[1])
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic(), copy.copy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+class DeadLetter:
+    def __init__(self, record: Any, stage: str, error: Exception,
+                 attempts: int) -> None:
+        self.record = record
+        self.stage = stage
+        self.error = error
+        self.attempts = attempts
+        self.failed_at: float = time.time()
+
+    def __repr__(self) -> str:
+        return (f"DeadLetter(stage={self.stage!r}, error={self.error!r}, "
+                f"attempts={self.attempts})")
+
+
+class DeadLetterQueue:
+    def __init__(self, max_size: int = 1000) -> None:
+        if max_size < 1:
+            raise ValueError("DeadLetterQueue: max_size must be >= 1")
+        self.max_size = max_size
+        self.dropped: int = 0
+        self._letters: Deque[DeadLetter] = deque(maxlen=max_size)
+
+    def __len__(self) -> int:
+        return len(self._letters)
+
+    def add(self, letter: DeadLetter) -> None:
+        if len(self._letters) == self.max_size:
+            self.dropped += 1
+        self._letters.append(letter)
+
+    def peek(self) -> List[DeadLetter]:
+        return list(self._letters)
+
+    def drain(self) -> List[DeadLetter]:
+        letters: List[DeadLetter] = list(self._letters)
+        self._letters.clear()
+        return letters
+
+
+class PipelineProfiler:
+    def __init__(self, sample_rate: float = 0.01, track_memory: bool = True,
+                 output: Optional[str] = None,
+                 seed: Optional[int] = None,
+                 max_per_second: Optional[int] = 100) -> None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("PipelineProfiler: sample_rate must be in [0, 1]")
+        if max_per_second is not None and max_per_second < 1:
+            raise ValueError("PipelineProfiler: max_per_second must be >= 1")
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self.track_memory = track_memory
+        self.output = output
+        self.seen: int = 0
+        self.sampled: int = 0
+        self.skipped: int = 0
+        self.throttled: int = 0
+        self._window_start: float = 0.0
+        self._window_count: int = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._memory: Dict[str, List[int]] = {}
+        self._started_tracing: bool = False
+        if output is not None:
+            atexit.register(self.dump)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = dict(self.__dict__)
+        state["_lock"] = None
+        state["_profiles"] = {}
+        state["_memory"] = {}
+        state["output"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self.start()
+
+    def start(self) -> None:
+        # tracemalloc runs for the whole session: starting and stopping it
+        # around every sampled record costs far more than the record.
+        if not self.track_memory or tracemalloc.is_tracing():
+            return
+        try:
+            tracemalloc.start()
+        except Exception:
+            self.skipped += 1
+            return
+        self._started_tracing = True
+
+    def stop(self) -> None:
+        if not self._started_tracing:
+            return
+        self._started_tracing = False
+        try:
+            tracemalloc.stop()
+        except Exception:
+            self.skipped += 1
+
+    def should_sample(self) -> bool:
+        self.seen += 1
+        if self._random.random() >= self.sample_rate:
+            return False
+        if self.max_per_second is None:
+            return True
+        now: float = time.monotonic()
+        if now - self._window_start >= 1.0:
+            self._window_start = now
+            self._window_count = 0
+        if self._window_count >= self.max_per_second:
+            self.throttled += 1
+            return False
+        self._window_count += 1
+        return True
+
+    def acquire(self) -> bool:
+        if not self._lock.acquire(blocking=False):
+            return False
+        self.sampled += 1
+        return True
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def run_stage(self, stage: Any, data: Any) -> Any:
+        name: str = stage.__class__.__name__
+        profile: cProfile.Profile = self._profiles.setdefault(
+            name, cProfile.Profile())
+        tracing: bool = tracemalloc.is_tracing()
+        before: int = 0
+        try:
+            if tracing:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+            profile.enable()
+        except Exception:
+            self.skipped += 1
+            return stage.process(data)
+        try:
+            return stage.process(data)
+        finally:
+            self._finish_stage(profile, name, tracing, before)
+
+    def _finish_stage(self, profile: cProfile.Profile, name: str,
+                      tracing: bool, before: int) -> None:
+        try:
+            profile.disable()
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                stats: List[int] = self._memory.setdefault(name, [0, 0, 0])
+                stats[0] += 1
+                stats[1] += current - before
+                stats[2] = max(stats[2], peak - before)
+        except Exception:
+            self.skipped += 1
+
+    def report(self, limit: int = 10) -> str:
+        out = io.StringIO()
+        out.write(f"Profiled {self.sampled} of {self.seen} records "
+                  f"(sample rate {self.sample_rate})\n")
+        if self.throttled:
+            out.write(f"Throttled {self.throttled} samples over "
+                      f"{self.max_per_second}/s\n")
+        if self.skipped:
+            out.write(f"Skipped {self.skipped} profiler setup/teardown "
+                      f"failures\n")
+        for name, (calls, retained, peak) in self._memory.items():
+            out.write(f"{name}: {calls} sampled calls, "
+                      f"avg retained {retained / calls:.0f} B, "
+                      f"peak {peak} B\n")
+        for name, profile in self._profiles.items():
+            out.write(f"\n--- {name} ---\n")
+            try:
+                pstats.Stats(profile, stream=out).sort_stats(
+                    "cumulative").print_stats(limit)
+            except TypeError:
+                out.write("no samples collected\n")
+        return out.getvalue()
+
+    def dump(self, path: Optional[str] = None) -> None:
+        self.stop()
+        path = path or self.output
+        if path is None:
+            tracer.info(self.report())
+            return
+        with open(path, "w") as f:
+            f.write(self.report())
+
+
+class AdaptiveController:
+    def __init__(self, target_latency: Optional[float] = None,
+                 min_batch: int = 1, max_batch: int = 10000,
+                 initial_batch: int = 64, max_workers: Optional[int] = None,
+                 window: int = 8, history: int = 100,
+                 deadband: float = 0.05) -> None:
+        if not 1 <= min_batch <= initial_batch <= max_batch:
+            raise ValueError("AdaptiveController: need "
+                             "1 <= min_batch <= initial_batch <= max_batch")
+        if window < 1:
+            raise ValueError("AdaptiveController: window must be >= 1")
+        if deadband < 0:
+            raise ValueError("AdaptiveController: deadband must be >= 0")
+        self.target_latency = target_latency
+        self.mode: str = "latency" if target_latency else "throughput"
+        self.min_batch = min_batch
+        self.max_batch = max_batch
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.window = window
+        self.deadband = deadband
+        self.batch_size: int = initial_batch
+        self.workers: int = 1
+        self.decisions: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._records: int = 0
+        self._elapsed: float = 0.0
+        self._wall: float = 0.0
+        self._observations: int = 0
+        self._parallel: bool = True
+        self._last_throughput: float = 0.0
+        self._directions: Dict[str, int] = {"batch_size": 1, "workers": 1}
+        self._last_step: Optional[str] = None
+        self._settled: Optional[float] = None
+        self._turn: int = 0
+
+    def observe(self, records: int, elapsed: float,
+                wall: Optional[float] = None, parallel: bool = False) -> None:
+        self._records += records
+        self._elapsed += elapsed
+        self._wall += elapsed if wall is None else wall
+        self._parallel = self._parallel and parallel
+        self._observations += 1
+        if self._observations >= self.window:
+            self._decide()
+
+    def _decide(self) -> None:
+        latency: float = self._elapsed / self._observations
+        throughput: float = (self._records / self._wall
+                             if self._wall > 0 else 0.0)
+        parallel: bool = self._parallel
+        self._records, self._elapsed, self._wall = 0, 0.0, 0.0
+        self._observations, self._parallel = 0, True
+        if self.mode == "latency":
+            reason: str = self._tune_latency(latency, parallel)
+        else:
+            reason = self._tune_throughput(throughput, parallel)
+        self._last_throughput = throughput
+        decision: Dict[str, Any] = {
+            "time": time.time(), "mode": self.mode,
+            "batch_size": self.batch_size, "workers": self.workers,
+            "latency": latency, "throughput": throughput, "reason": reason}
+        self.decisions.append(decision)
+        if tracer.level <= INFO:
+            tracer.emit(INFO, f"Autotune: {reason} -> batch_size="
+                              f"{self.batch_size}, workers={self.workers} "
+                              f"(latency {latency * 1000:.2f} ms, "
+                              f"{throughput:.0f} rec/s)")
+
+    def _tune_latency(self, latency: float, parallel: bool) -> str:
+        target: float = self.target_latency or 0.0
+        if latency > target * (1 + self.deadband):
+            if self.batch_size > self.min_batch:
+                self.batch_size = max(self.min_batch, self.batch_size // 2)
+                return "latency above target, halving batch size"
+            if parallel and self.workers < self.max_workers:
+                self.workers += 1
+                return "latency above target at minimum batch, adding worker"
+            return "latency above target, no headroom left"
+        if latency < target * (1 - self.deadband) and \
+                self.batch_size < self.max_batch:
+            self.batch_size = min(self.max_batch,
+                                  self.batch_size + max(1,
+                                                        self.batch_size // 4))
+            return "latency below target, growing batch size"
+        return "latency on target, holding"
+
+    def _tune_throughput(self, throughput: float, parallel: bool) -> str:
+        if self._settled is not None:
+            if abs(throughput - self._settled) <= \
+                    self._settled * self.deadband:
+                return "throughput steady, holding"
+            self._settled = None
+        elif self._last_step is not None and self._last_throughput > 0:
+            change: float = throughput / self._last_throughput - 1
+            last: str = self._last_step
+            self._last_step = None
+            if change < -self.deadband:
+                self._directions[last] *= -1
+                self._step(last, self._directions[last])
+                return f"throughput down, reverting {last.replace('_', ' ')}"
+            if change <= self.deadband:
+                self._settled = throughput
+                return "throughput change within noise, holding"
+        dimensions: List[str] = (["batch_size", "workers"] if parallel
+                                 else ["batch_size"])
+        self._turn += 1
+        dimension: str = dimensions[self._turn % len(dimensions)]
+        direction: int = self._directions[dimension]
+        self._step(dimension, direction)
+        self._last_step = dimension
+        return (f"stepping {dimension.replace('_', ' ')} "
+                f"{'up' if direction > 0 else 'down'}")
+
+    def _step(self, dimension: str, direction: int) -> None:
+        if dimension == "workers":
+            self.workers = min(self.max_workers,
+                               max(1, self.workers + direction))
+        elif direction > 0:
+            self.batch_size = min(self.max_batch, self.batch_size * 2)
+        else:
+            self.batch_size = max(self.min_batch, self.batch_size // 2)
 
 
 class ProcessingPipeline(ABC):
     def __init__(self) -> None:
         super().__init__()
-        self.stages: List[ProcessingStage] = []
+        self.stages: List[Union[ProcessingStage, BatchProcessingStage,
+                                AsyncProcessingStage]] = []
         self.processed_count: int = 0
         self.total_time: float = 0.0
+        self.concurrency: int = 100
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.cache: Optional[ResultCache] = None
+        self._cache_split: int = 0
+        self.dead_letters: DeadLetterQueue = DeadLetterQueue()
+        self.max_retries: int = 2
+        self.retry_backoff: float = 0.01
+        self.transient_errors: Tuple[type, ...] = (TimeoutError,
+                                                   ConnectionError)
+        self.profiler: Optional[PipelineProfiler] = None
+        self.controller: Optional[AdaptiveController] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = dict(self.__dict__)
+        state["_semaphore"] = None
+        state["_semaphore_loop"] = None
+        state["stages"] = [_without_sink(stage) for stage in self.stages]
+        return state
 
-    def add_stage(self, stage: ProcessingStage) -> None:
+    def add_stage(self, stage: Union[ProcessingStage, BatchProcessingStage,
+                                     AsyncProcessingStage]) -> None:
         self.stages.append(stage)
+        if self._cache_split == len(self.stages) - 1 and \
+                getattr(stage, "cacheable", True):
+            self._cache_split = len(self.stages)
+
+    def enable_cache(self, max_size: int = 1024,
+                     ttl: Optional[float] = None) -> None:
+        self.cache = ResultCache(max_size, ttl)
+
+    def disable_cache(self) -> None:
+        self.cache = None
+
+    def set_concurrency(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("ProcessingPipeline: concurrency must be >= 1")
+        self.concurrency = limit
+        self._semaphore = None
 
     def run_stages(self, data: Any) -> Union[str, Any]:
+        current = data
+        start = time.perf_counter()
+        try:
+            current = self._run_record(data)
+            self.processed_count += 1
+        except StageError as e:
+            if not isinstance(e.error, ValueError):
+                raise e.error
+            current = e.partial
+            if tracer.level <= ERROR:
+                tracer.emit(ERROR, f"Error in stage "
+                                   f"{e.stage.__class__.__name__}: {e}")
+                tracer.emit(ERROR, "Recovery initiated: "
+                                   "Switching to backup processor")
+                tracer.emit(ERROR, "Recovery successful: "
+                                   "Pipeline restored, processing resumed")
+        finally:
+            elapsed = time.perf_counter() - start
+            self.total_time += elapsed
+        return current
+
+    def enable_autotune(self, target_latency: Optional[float] = None,
+                        **options: Any) -> AdaptiveController:
+        self.controller = AdaptiveController(target_latency, **options)
+        return self.controller
+
+    def disable_autotune(self) -> None:
+        self.controller = None
+
+    def enable_profiling(self, sample_rate: float = 0.01,
+                         track_memory: bool = True,
+                         output: Optional[str] = None,
+                         max_per_second: Optional[int] = 100
+                         ) -> PipelineProfiler:
+        self.disable_profiling()
+        self.profiler = PipelineProfiler(sample_rate, track_memory, output,
+                                         max_per_second=max_per_second)
+        self.profiler.start()
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        if self.profiler is not None:
+            self.profiler.stop()
+        self.profiler = None
+
+    def _run_record(self, data: Any) -> Any:
+        profiler: Optional[PipelineProfiler] = self.profiler
+        if profiler is not None and profiler.should_sample() and \
+                profiler.acquire():
+            try:
+                return self._run_profiled(profiler, data)
+            finally:
+                profiler.release()
+        if self.cache is not None:
+            return self._run_cached(data)
+        return self._run_range(data, 0, len(self.stages))
+
+    def configure_retries(self, max_retries: int = 2,
+                          backoff: float = 0.01,
+                          transient_errors: Optional[
+                              Tuple[type, ...]] = None) -> None:
+        if max_retries < 0 or backoff < 0:
+            raise ValueError("ProcessingPipeline: retries and backoff "
+                             "must be >= 0")
+        self.max_retries = max_retries
+        self.retry_backoff = backoff
+        if transient_errors is not None:
+            self.transient_errors = transient_errors
+
+    def process_batch(self, records: Iterable[Any]) -> List[Any]:
+        batch: List[Any] = list(records)
+        start = time.perf_counter()
+        try:
+            results: List[Any] = self._run_batch(batch)
+            self.processed_count += len(results)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.total_time += elapsed
+            if self.controller is not None:
+                self.controller.observe(len(batch), elapsed)
+        return results
+
+    def process_adaptive(self, records: Iterable[Any]) -> Iterator[Any]:
+        if self.controller is None:
+            self.enable_autotune()
+        iterator: Iterator[Any] = iter(records)
+        while True:
+            batch: List[Any] = list(islice(iterator,
+                                           self.controller.batch_size))
+            if not batch:
+                return
+            yield from self.process_batch(batch)
+
+    def _run_batch(self, batch: List[Any]) -> List[Any]:
+        split: int = self._cache_split if self.cache is not None else 0
+        if split == 0:
+            return self._run_batch_stages(batch, list(range(len(batch))),
+                                          batch, 0, len(self.stages))[1]
+        keys: List[Optional[str]] = [content_key(record) for record in batch]
+        heads: Dict[int, Any] = {}
+        missing: List[int] = []
+        for index, key in enumerate(keys):
+            hit, head = (False, None) if key is None else self.cache.get(key)
+            if hit:
+                heads[index] = head
+            else:
+                missing.append(index)
+        if missing:
+            survivors, computed = self._run_batch_stages(
+                batch, missing, [batch[index] for index in missing],
+                0, split)
+            for index, head in zip(survivors, computed):
+                heads[index] = head
+                if keys[index] is not None:
+                    self.cache.put(keys[index], head)
+        present: List[int] = sorted(heads)
+        return self._run_batch_stages(batch, present,
+                                      [heads[index] for index in present],
+                                      split, len(self.stages))[1]
+
+    def _run_batch_stages(self, batch: List[Any], indices: List[int],
+                          current: List[Any], begin: int,
+                          end: int) -> Tuple[List[int], List[Any]]:
+        for stage in self.stages[begin:end]:
+            if not current:
+                break
+            try:
+                process_many = getattr(stage, "process_many", None)
+                if process_many is not None:
+                    produced: List[Any] = process_many(current)
+                else:
+                    process = stage.process
+                    produced = [process(record) for record in current]
+            except Exception:
+                # Only this stage is re-run, one record at a time, on its
+                # own inputs; earlier stages' outputs are kept.
+                indices, produced = self._isolate_stage(stage, batch,
+                                                        indices, current)
+            if produced and inspect.isawaitable(produced[0]):
+                for record in produced[1:]:
+                    if inspect.iscoroutine(record):
+                        record.close()
+                raise _awaitable_error(stage, produced[0])
+            current = produced
+        return indices, current
+
+    def _isolate_stage(self, stage: ProcessingStage, batch: List[Any],
+                       indices: List[int],
+                       current: List[Any]) -> Tuple[List[int], List[Any]]:
+        kept: List[int] = []
+        produced: List[Any] = []
+        for index, record in zip(indices, current):
+            ok, value = self._run_with_retry(stage, record, batch[index])
+            if ok:
+                kept.append(index)
+                produced.append(value)
+        return kept, produced
+
+    def _run_with_retry(self, stage: ProcessingStage, record: Any,
+                        source: Any) -> Tuple[bool, Any]:
+        attempt: int = 0
+        while True:
+            attempt += 1
+            try:
+                return True, stage.process(record)
+            except Exception as e:
+                if isinstance(e, self.transient_errors) and \
+                        attempt <= self.max_retries:
+                    time.sleep(self.retry_backoff * 2 ** (attempt - 1))
+                    continue
+                self.dead_letters.add(
+                    DeadLetter(source, stage.__class__.__name__, e, attempt))
+                if tracer.level <= WARNING:
+                    tracer.emit(WARNING, f"Dead-lettered record in stage "
+                                         f"{stage.__class__.__name__} "
+                                         f"after {attempt} attempt(s): "
+                                         f"{e}")
+                return False, None
+
+    def _run_profiled(self, profiler: PipelineProfiler, data: Any) -> Any:
+        current = data
+        for stage in self.stages:
+            try:
+                current = profiler.run_stage(stage, current)
+            except Exception as e:
+                raise StageError(stage, current, e) from e
+            if inspect.isawaitable(current):
+                raise _awaitable_error(stage, current)
+        return current
+
+    def _run_cached(self, data: Any) -> Any:
+        split: int = self._cache_split
+        key: Optional[str] = content_key(data) if split > 0 else None
+        if key is None:
+            return self._run_range(data, 0, len(self.stages))
+        hit, head = self.cache.get(key)
+        if not hit:
+            head = self._run_range(data, 0, split)
+            self.cache.put(key, head)
+        return self._run_range(head, split, len(self.stages))
+
+    def _run_range(self, data: Any, begin: int, end: int) -> Any:
+        current = data
+        position = begin
+        try:
+            for position in range(begin, end):
+                current = self.stages[position].process(current)
+        except Exception as e:
+            if position > begin and inspect.isawaitable(current):
+                raise _awaitable_error(self.stages[position - 1],
+                                       current) from e
+            raise StageError(self.stages[position], current, e) from e
+        if end > begin and inspect.isawaitable(current):
+            raise _awaitable_error(self.stages[end - 1], current)
+        return current
+
+    async def run_stages_async(self, data: Any) -> Union[str, Any]:
         current = data
         start = time.perf_counter()
         try:
             for stage in self.stages:
                 current = stage.process(current)
+                if inspect.isawaitable(current):
+                    current = await current
             self.processed_count += 1
         except ValueError as e:
-            print(f"Error in stage {stage.__class__.__name__}: {e}")
-            print("Recovery initiated: Switching to backup processor")
-            print("Recovery successful: Pipeline restored, processing resumed")
+            if tracer.level <= ERROR:
+                tracer.emit(ERROR, f"Error in stage "
+                                   f"{stage.__class__.__name__}: {e}")
+                tracer.emit(ERROR, "Recovery initiated: "
+                                   "Switching to backup processor")
+                tracer.emit(ERROR, "Recovery successful: "
+                                   "Pipeline restored, processing resumed")
         finally:
             elapsed = time.perf_counter() - start
             self.total_time += elapsed
         return current
 
+    async def process_async(self, data: Any) -> Union[str, Any]:
+        semaphore = self._get_semaphore()
+        async with semaphore:
+            return await self.run_stages_async(data)
+
+    async def process_many_async(self, records: Iterable[Any]) -> List[Any]:
+        return await _gather_bounded(self.process_async, records,
+                                     self.concurrency)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def process_iter(self, records: Iterable[Any]) -> Iterator[Any]:
+        for record in records:
+            yield self.process(record)
+
+    def process_parallel(self, records: Iterable[Any],
+                         workers: Optional[int] = None,
+                         chunk_size: int = 1000) -> List[Any]:
+        if chunk_size < 1:
+            raise ValueError("ProcessingPipeline: chunk_size must be >= 1")
+        controller: Optional[AdaptiveController] = self.controller
+        if controller is not None:
+            workers = workers or controller.max_workers
+        workers = workers or os.cpu_count() or 1
+        results: List[Any] = []
+        pending: Deque[Future] = deque()
+        mark: float = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_chunk_worker,
+                                 initargs=(self,)) as executor:
+            for chunk in _chunked(records, chunk_size, controller):
+                pending.append(executor.submit(_run_chunk, chunk))
+                while len(pending) >= self._in_flight(workers):
+                    mark = self._merge_chunk(pending.popleft(), results, mark)
+            while pending:
+                mark = self._merge_chunk(pending.popleft(), results, mark)
+        return results
+
+    def _in_flight(self, workers: int) -> int:
+        if self.controller is None:
+            return workers * 2
+        return min(workers, self.controller.workers)
+
+    def _merge_chunk(self, future: Future, results: List[Any],
+                     mark: float) -> float:
+        chunk_res, delivered, count, elapsed = future.result()
+        now: float = time.perf_counter()
+        results.extend(chunk_res)
+        self._write_sinks(delivered)
+        self.processed_count += count
+        self.total_time += elapsed
+        if self.controller is not None:
+            self.controller.observe(len(chunk_res), elapsed,
+                                    wall=now - mark, parallel=True)
+        return now
+
+    def _capture_sinks(self) -> None:
+        self.stages = [_without_sink(stage) for stage in self.stages]
+
+    def _drain_sinks(self) -> Dict[int, List[str]]:
+        delivered: Dict[int, List[str]] = {}
+        for position, stage in enumerate(self.stages):
+            sink: Any = getattr(stage, "sink", None)
+            if isinstance(sink, _CapturedSink):
+                lines: List[str] = sink.drain()
+                if lines:
+                    delivered[position] = lines
+        return delivered
+
+    def _write_sinks(self, delivered: Dict[int, List[str]]) -> None:
+        for position, lines in delivered.items():
+            self.stages[position].sink.write_many(lines)
+
     @abstractmethod
     def process(self, data: Any) -> Any:
         pass
 
 
+def _chunked(records: Iterable[Any], size: int,
+             controller: Optional[AdaptiveController] = None
+             ) -> Iterable[List[Any]]:
+    iterator = iter(records)
+    while True:
+        if controller is not None:
+            size = controller.batch_size
+        chunk: List[Any] = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _gather_bounded(func: Callable[[Any], Awaitable[Any]],
+                          records: Iterable[Any], limit: int) -> List[Any]:
+    iterator = enumerate(records)
+    results: Dict[int, Any] = {}
+
+    async def worker() -> None:
+        for index, record in iterator:
+            results[index] = await func(record)
+
+    await asyncio.gather(*(worker() for _ in range(max(limit, 1))))
+    return [results[index] for index in range(len(results))]
+
+
+def _awaitable_error(stage: Any, value: Any) -> TypeError:
+    if inspect.iscoroutine(value):
+        value.close()
+    return TypeError(f"{stage.__class__.__name__} returned an awaitable; "
+                     f"async stages need run_stages_async or process_async")
+
+
+_worker_pipeline: Optional[ProcessingPipeline] = None
+
+
+def _init_chunk_worker(pipeline: ProcessingPipeline) -> None:
+    global _worker_pipeline
+    pipeline._capture_sinks()
+    _worker_pipeline = pipeline
+
+
+def _run_chunk(chunk: List[Any]) -> Tuple[List[Any], Dict[int, List[str]],
+                                          int, float]:
+    pipeline: Optional[ProcessingPipeline] = _worker_pipeline
+    if pipeline is None:
+        raise RuntimeError("_run_chunk: worker has no pipeline")
+    pipeline.processed_count = 0
+    pipeline.total_time = 0.0
+    results: List[Any] = [pipeline.run_stages(record) for record in chunk]
+    _flush_open_sinks()
+    tracer.flush()
+    return (results, pipeline._drain_sinks(), pipeline.processed_count,
+            pipeline.total_time)
+
+
 class JSONAdapter(ProcessingPipeline):
     def __init__(self, pipeline_id: str) -> None:
         super().__init__()
         self.pipeline_id = pipeline_id
 
     def process(self, data: Any) -> Union[str, Any]:
-        print(f"Processing data through {self.pipeline_id}...")
+        if tracer.level <= INFO:
+            tracer.emit(INFO,
+                        f"Processing data through {self.pipeline_id}...")
         return self.run_stages(data)
 
 
@@ -151,7 +1525,9 @@ class CSVAdapter(ProcessingPipeline):
         self.pipeline_id = pipeline_id
 
     def process(self, data: Any) -> Union[str, Any]:
-        print(f"Processing data through {self.pipeline_id}...")
+        if tracer.level <= INFO:
+            tracer.emit(INFO,
+                        f"Processing data through {self.pipeline_id}...")
         return self.run_stages(data)
 
 
@@ -161,14 +1537,210 @@ class StreamAdapter(ProcessingPipeline):
         self.pipeline_id = pipeline_id
 
     def process(self, data: Any) -> Union[str, Any]:
-        print(f"Processing data through {self.pipeline_id}...")
+        if tracer.level <= INFO:
+            tracer.emit(INFO,
+                        f"Processing data through {self.pipeline_id}...")
         return self.run_stages(data)
 
 
+_TAG_PICKLE, _TAG_STR, _TAG_ARRAY, _TAG_FLOATS, _TAG_RECORD, _TAG_END = \
+    range(6)
+_FRAME = struct.Struct("<IB")
+_RECORD = struct.Struct("<IB")
+_POSITION = struct.Struct("<Q")
+_RING_HEADER: int = 2 * _POSITION.size
+_RING_END: object = object()
+
+
+class _ForwardedError:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _encode_shared(value: Any) -> Tuple[int, List[Any]]:
+    if value is _RING_END:
+        return _TAG_END, []
+    if type(value) is str:
+        return _TAG_STR, [value.encode("utf-8")]
+    if isinstance(value, array) and value.typecode in NUMERIC_TYPECODES:
+        return _TAG_ARRAY, [value.typecode.encode("ascii"), value]
+    if type(value) is list and value and \
+            all(type(item) is float for item in value):
+        return _TAG_FLOATS, [array("d", value)]
+    if type(value) is dict and "values" in value:
+        tag, parts = _encode_shared(value["values"])
+        if tag in (_TAG_ARRAY, _TAG_FLOATS):
+            meta: Dict[str, Any] = dict(value)
+            meta["values"] = None
+            header: bytes = pickle.dumps(meta, pickle.HIGHEST_PROTOCOL)
+            return _TAG_RECORD, [_RECORD.pack(len(header), tag), header,
+                                 *parts]
+    return _TAG_PICKLE, [pickle.dumps(value, pickle.HIGHEST_PROTOCOL)]
+
+
+def _decode_shared(tag: int, body: memoryview) -> Any:
+    if tag == _TAG_STR:
+        return str(body, "utf-8")
+    if tag == _TAG_ARRAY:
+        values: array = array(chr(body[0]))
+        values.frombytes(body[1:])
+        return values
+    if tag == _TAG_FLOATS:
+        floats: array = array("d")
+        floats.frombytes(body)
+        return floats.tolist()
+    if tag == _TAG_RECORD:
+        size, inner = _RECORD.unpack_from(body)
+        start: int = _RECORD.size + size
+        record: Dict[str, Any] = pickle.loads(body[_RECORD.size:start])
+        record["values"] = _decode_shared(inner, body[start:])
+        return record
+    if tag == _TAG_END:
+        return _RING_END
+    return pickle.loads(body)
+
+
+class SharedRingBuffer:
+    def __init__(self, capacity: int = 1 << 22) -> None:
+        if capacity < 64:
+            raise ValueError("SharedRingBuffer: capacity must be >= 64")
+        self.capacity = capacity
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=_RING_HEADER + capacity)
+        self._shm.buf[:_RING_HEADER] = bytes(_RING_HEADER)
+        self._ready = multiprocessing.Condition()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"capacity": self.capacity, "name": self._shm.name,
+                "ready": self._ready}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.capacity = state["capacity"]
+        self._ready = state["ready"]
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+
+    def put(self, value: Any) -> None:
+        tag, parts = _encode_shared(value)
+        views: List[memoryview] = [memoryview(part).cast("B")
+                                   for part in parts]
+        length: int = sum(view.nbytes for view in views)
+        size: int = _FRAME.size + length
+        if size > self.capacity:
+            raise ValueError(f"SharedRingBuffer: {size} byte record exceeds "
+                             f"capacity of {self.capacity} bytes")
+        with self._ready:
+            head: int = self._position(0)
+            while self.capacity - (head - self._position(1)) < size:
+                self._ready.wait()
+        position: int = self._copy_in(head, _FRAME.pack(length, tag))
+        for view in views:
+            position = self._copy_in(position, view)
+        with self._ready:
+            _POSITION.pack_into(self._shm.buf, 0, head + size)
+            self._ready.notify_all()
+
+    def put_end(self) -> None:
+        self.put(_RING_END)
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        deadline: Optional[float] = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        with self._ready:
+            tail: int = self._position(1)
+            while self._position(0) == tail:
+                remaining: Optional[float] = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("SharedRingBuffer: no record "
+                                           "within timeout")
+                self._ready.wait(remaining)
+        with self._copy_out(tail, _FRAME.size) as frame:
+            length, tag = _FRAME.unpack(frame)
+        with self._copy_out(tail + _FRAME.size, length) as body:
+            value: Any = _decode_shared(tag, body)
+        with self._ready:
+            _POSITION.pack_into(self._shm.buf, _POSITION.size,
+                                tail + _FRAME.size + length)
+            self._ready.notify_all()
+        return value
+
+    def close(self) -> None:
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+    def _position(self, index: int) -> int:
+        return _POSITION.unpack_from(self._shm.buf,
+                                     index * _POSITION.size)[0]
+
+    def _copy_in(self, position: int, data: Any) -> int:
+        size: int = len(data)
+        start: int = position % self.capacity
+        first: int = min(size, self.capacity - start)
+        buf: memoryview = self._shm.buf
+        buf[_RING_HEADER + start:_RING_HEADER + start + first] = data[:first]
+        if first < size:
+            buf[_RING_HEADER:_RING_HEADER + size - first] = data[first:]
+        return position + size
+
+    def _copy_out(self, position: int, size: int) -> memoryview:
+        start: int = position % self.capacity
+        buf: memoryview = self._shm.buf
+        if start + size <= self.capacity:
+            return buf[_RING_HEADER + start:_RING_HEADER + start + size]
+        first: int = self.capacity - start
+        return memoryview(bytes(buf[_RING_HEADER + start:]) +
+                          bytes(buf[_RING_HEADER:
+                                    _RING_HEADER + size - first]))
+
+
+def _feed_ring(records: Iterable[Any], ring: SharedRingBuffer) -> None:
+    try:
+        for record in records:
+            ring.put(record)
+    except Exception as error:
+        ring.put(_ForwardedError(error))
+    finally:
+        ring.put_end()
+
+
+def _run_distributed(pipeline: ProcessingPipeline, index: int,
+                     inbound: SharedRingBuffer, outbound: SharedRingBuffer,
+                     stats: Any) -> None:
+    pipeline._capture_sinks()
+    processed: int = pipeline.processed_count
+    elapsed: float = pipeline.total_time
+    while True:
+        record: Any = inbound.get()
+        if record is _RING_END:
+            break
+        if not isinstance(record, _ForwardedError):
+            try:
+                record = pipeline.process(record)
+            except Exception as error:
+                record = _ForwardedError(error)
+        try:
+            outbound.put(record)
+        except Exception as error:
+            outbound.put(_ForwardedError(error))
+    outbound.put_end()
+    _flush_open_sinks()
+    tracer.flush()
+    stats.put((index, pipeline._drain_sinks(),
+               pipeline.processed_count - processed,
+               pipeline.total_time - elapsed))
+    inbound.close()
+    outbound.close()
+
+
 class NexusManager:
     def __init__(self) -> None:
         self.pipelines: List[ProcessingPipeline] = []
-        print("Initializing Nexus Manager...")
+        self.graph: Dict[ProcessingPipeline, List[ProcessingPipeline]] = {}
+        tracer.info("Initializing Nexus Manager...")
 
     def add_pipeline(self, pipeline: ProcessingPipeline) -> None:
         self.pipelines.append(pipeline)
@@ -179,25 +1751,173 @@ class NexusManager:
             current = pipeline.process(current)
         return current
 
+    def process_stream(self, records: Iterable[Any]) -> Iterator[Any]:
+        stream: Iterable[Any] = records
+        for pipeline in self.pipelines:
+            stream = pipeline.process_iter(stream)
+        return iter(stream)
+
+    def add_node(self, pipeline: ProcessingPipeline) -> None:
+        self.graph.setdefault(pipeline, [])
+
+    def connect(self, upstream: ProcessingPipeline,
+                downstream: ProcessingPipeline) -> None:
+        if upstream is downstream or \
+                self._reaches(downstream, upstream):
+            raise ValueError("NexusManager: connection would create a cycle")
+        self.add_node(upstream)
+        self.add_node(downstream)
+        if upstream not in self.graph[downstream]:
+            self.graph[downstream].append(upstream)
+
+    def _reaches(self, source: ProcessingPipeline,
+                 target: ProcessingPipeline) -> bool:
+        children: Dict[ProcessingPipeline, List[ProcessingPipeline]] = \
+            self._children()
+        stack: List[ProcessingPipeline] = [source]
+        seen: Set[ProcessingPipeline] = set()
+        while stack:
+            node = stack.pop()
+            if node is target:
+                return True
+            if node not in seen:
+                seen.add(node)
+                stack.extend(children.get(node, []))
+        return False
+
+    def _children(self) -> Dict[ProcessingPipeline, List[ProcessingPipeline]]:
+        children: Dict[ProcessingPipeline, List[ProcessingPipeline]] = {
+            node: [] for node in self.graph}
+        for node, parents in self.graph.items():
+            for parent in parents:
+                children[parent].append(node)
+        return children
+
+    def process_graph(self, data: Any,
+                      max_workers: Optional[int] = None) -> Dict[str, Any]:
+        children: Dict[ProcessingPipeline, List[ProcessingPipeline]] = \
+            self._children()
+        waiting: Dict[ProcessingPipeline, int] = {
+            node: len(parents) for node, parents in self.graph.items()}
+        results: Dict[ProcessingPipeline, Any] = {}
+        running: Dict[Future, ProcessingPipeline] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for node, count in waiting.items():
+                if count == 0:
+                    running[executor.submit(node.process, data)] = node
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    results[node] = future.result()
+                    for child in children[node]:
+                        waiting[child] -= 1
+                        if waiting[child] == 0:
+                            running[executor.submit(
+                                child.process,
+                                self._join_inputs(child, results))] = child
+        return {self._node_name(node): results[node]
+                for node, nodes in children.items() if not nodes}
+
+    def _join_inputs(self, node: ProcessingPipeline,
+                     results: Dict[ProcessingPipeline, Any]) -> Any:
+        parents: List[ProcessingPipeline] = self.graph[node]
+        if len(parents) == 1:
+            return results[parents[0]]
+        return [results[parent] for parent in parents]
+
+    def _node_name(self, pipeline: ProcessingPipeline) -> str:
+        return getattr(pipeline, "pipeline_id", pipeline.__class__.__name__)
+
+    def process_distributed(self, records: Iterable[Any],
+                            capacity: int = 1 << 22) -> List[Any]:
+        if not self.pipelines:
+            return list(records)
+        rings: List[SharedRingBuffer] = [
+            SharedRingBuffer(capacity) for _ in range(len(self.pipelines) + 1)]
+        stats: Any = multiprocessing.Queue()
+        workers: List[multiprocessing.Process] = [
+            multiprocessing.Process(
+                target=_run_distributed, daemon=True,
+                args=(pipeline, index, rings[index], rings[index + 1], stats))
+            for index, pipeline in enumerate(self.pipelines)]
+        feeder: threading.Thread = threading.Thread(
+            target=_feed_ring, args=(records, rings[0]), daemon=True)
+        results: List[Any] = []
+        error: Optional[BaseException] = None
+        try:
+            for worker in workers:
+                worker.start()
+            feeder.start()
+            while True:
+                record: Any = self._next_distributed(rings[-1], workers)
+                if record is _RING_END:
+                    break
+                if isinstance(record, _ForwardedError):
+                    error = error or record.error
+                else:
+                    results.append(record)
+            for _ in workers:
+                index, delivered, count, elapsed = stats.get()
+                self.pipelines[index]._write_sinks(delivered)
+                self.pipelines[index].processed_count += count
+                self.pipelines[index].total_time += elapsed
+            feeder.join()
+            for worker in workers:
+                worker.join()
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+            for ring in rings:
+                ring.close()
+                ring.unlink()
+        if error is not None:
+            raise error
+        return results
+
+    def _next_distributed(self, ring: SharedRingBuffer,
+                          workers: List[multiprocessing.Process]) -> Any:
+        while True:
+            try:
+                return ring.get(timeout=0.5)
+            except TimeoutError:
+                for worker in workers:
+                    if worker.exitcode not in (None, 0):
+                        raise RuntimeError(
+                            f"NexusManager: pipeline worker exited with "
+                            f"code {worker.exitcode}")
+
+    async def process_data_async(self, data: Any) -> Any:
+        current = data
+        for pipeline in self.pipelines:
+            current = await pipeline.process_async(current)
+        return current
+
+    async def process_many_async(self, records: Iterable[Any],
+                                 concurrency: int = 1000) -> List[Any]:
+        return await _gather_bounded(self.process_data_async, records,
+                                     concurrency)
+
 
 if __name__ == "__main__":
-    print("=== CODE NEXUS - ENTERPRISE PIPELINE SYSTEM ===")
-    print()
+    tracer.info("=== CODE NEXUS - ENTERPRISE PIPELINE SYSTEM ===")
+    tracer.info("")
 
     nex_manager = NexusManager()
 
-    print("Creating Data Processing Pipeline...")
+    tracer.info("Creating Data Processing Pipeline...")
 
-    print("Stage 1: Input validation and parsing")
+    tracer.info("Stage 1: Input validation and parsing")
     input_stage: InputStage = InputStage()
 
-    print("Stage 2: Data transformation and enrichment")
+    tracer.info("Stage 2: Data transformation and enrichment")
     transform_stage: TransformStage = TransformStage()
 
-    print("Stage 3: Output formatting and delivery")
+    tracer.info("Stage 3: Output formatting and delivery")
     output_stage: OutputStage = OutputStage()
-    print()
-    print("=== Multi-Format Data Processing ===\n")
+    tracer.info("")
+    tracer.info("=== Multi-Format Data Processing ===\n")
 
     json_format = '{"sensor": "temp", "value": 23.5, "unit": "C"}'
     csv_format = "user,action,timestamp\ndanborys, login, 05.02.2026"
@@ -208,16 +1928,16 @@ if __name__ == "__main__":
     json_adapter.add_stage(transform_stage)
     json_adapter.add_stage(output_stage)
 
-    print("Processing JSON data through pipeline...")
+    tracer.info("Processing JSON data through pipeline...")
     json_adapter.process(json_format)
-    print()
-    print("Processing SCV data through pipeline...")
+    tracer.info("")
+    tracer.info("Processing SCV data through pipeline...")
     json_adapter.process(csv_format)
-    print()
-    print("Processing stream data through pipeline...")
+    tracer.info("")
+    tracer.info("Processing stream data through pipeline...")
     json_adapter.process(stream_format)
 
-    print("\n=== Pipeline Chaining Demo ===")
+    tracer.info("\n=== Pipeline Chaining Demo ===")
     pipeline_a: ProcessingPipeline = CSVAdapter("A")
     pipeline_a.add_stage(input_stage)
     pipeline_b: ProcessingPipeline = JSONAdapter("B")
@@ -228,14 +1948,15 @@ if __name__ == "__main__":
     nex_manager.add_pipeline(pipeline_b)
     nex_manager.add_pipeline(pipeline_c)
     nex_manager.process_data(json_format)
-    print()
+    tracer.info("")
 
-    print("Chain result: 100 records processed through 3-stage pipeline\n")
+    tracer.info("Chain result: 100 records processed "
+                "through 3-stage pipeline\n")
     for i in range(0, 100):
         json_adapter.process([json_format, csv_format, stream_format][i % 3])
-    print(f"\nPerformance: {json_adapter.total_time:.4f}s "
-          f"total processing time")
+    tracer.info(f"\nPerformance: {json_adapter.total_time:.4f}s "
+                f"total processing time")
 
-    print("\n=== Error Recovery Test ===")
-    print("Simulating pipeline failure...")
+    tracer.info("\n=== Error Recovery Test ===")
+    tracer.info("Simulating pipeline failure...")
     json_adapter.process('{"sensor": "temp", "value": "dfdfsd", "unit": "C"}')
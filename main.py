@@ -37,6 +37,16 @@ Examples:
 import sys
 import importlib.util
 import ast
+import gc
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from multiprocessing.connection import Connection
 from typing import List, Dict, Any, Optional, Tuple  # noqa: F401
 from pathlib import Path
 
@@ -63,76 +73,207 @@ class TestResult:
         self.passed = True
 
 
+class _TypingVisitor:
+    """Collects every typing check in a single pass over the AST."""
+
+    def __init__(self) -> None:
+        self.has_typing_imports: bool = False
+        self.function_count: int = 0
+        self.typed_functions: int = 0
+        self.parameter_issues: List[str] = []
+
+    def visit(self, node: ast.AST) -> None:
+        """Record whatever the given node contributes to the checks."""
+        if isinstance(node, ast.ImportFrom):
+            if node.module == "typing":
+                self.has_typing_imports = True
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == "typing":
+                    self.has_typing_imports = True
+        elif isinstance(node, ast.FunctionDef):
+            self.function_count += 1
+
+            # Check return type annotation
+            if node.returns is not None:
+                self.typed_functions += 1
+
+            # Check parameter type annotations
+            for arg in node.args.args:
+                if arg.annotation is None and arg.arg != "self":
+                    self.parameter_issues.append(
+                        f"Function '{node.name}' parameter "
+                        f"'{arg.arg}' missing type annotation"
+                    )
+
+
 class TypeChecker:
     """Validates type annotations in Python code."""
 
-    def __init__(self) -> None:
+    # Bump whenever the checks change so cached results are invalidated.
+    VERSION = "2"
+
+    def __init__(self,
+                 cache_path: Optional[str] = ".typecheck_cache.json") -> None:
         self.required_imports = [
             "typing", "Any", "List", "Dict", "Union", "Optional"
         ]
+        self.cache_path: Optional[str] = cache_path
+        self._cache: Optional[Dict[str, Any]] = None
+        self._pending: Dict[str, Any] = {}
 
     def check_file_typing(self, file_path: str) -> Tuple[bool, List[str]]:
         """Check if file has proper type annotations."""
         try:
-            with open(file_path, 'r') as f:
+            with open(file_path, 'rb') as f:
                 content = f.read()
 
-            tree = ast.parse(content)
-            issues = []
-            has_typing_imports = False
-
-            # Check for typing imports
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ImportFrom) and node.module == "typing":
-                    has_typing_imports = True
-                elif isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name == "typing":
-                            has_typing_imports = True
-
-            if not has_typing_imports:
-                issues.append("Missing typing imports")
-
-            # Check function definitions for type annotations
-            function_count = 0
-            typed_functions = 0
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    function_count += 1
-
-                    # Check return type annotation
-                    if node.returns is not None:
-                        typed_functions += 1
-
-                    # Check parameter type annotations
-                    for arg in node.args.args:
-                        if arg.annotation is None and arg.arg != "self":
-                            issues.append(
-                                f"Function '{node.name}' parameter "
-                                f"'{arg.arg}' missing type annotation"
-                            )
-
-            if function_count > 0:
-                typing_coverage = (typed_functions / function_count) * 100
-                if typing_coverage < 80:
-                    issues.append(
-                        f"Low typing coverage: {typing_coverage:.1f}% of "
-                        f"functions have return type annotations"
-                    )
+            key = self._cache_key(content)
+            cached = self._load_cache().get(key)
+            if cached is not None:
+                return cached[0], list(cached[1])
 
-            return len(issues) == 0, issues
+            passed, issues = self._analyze(content)
+            self._store(key, passed, issues)
+            return passed, issues
 
         except Exception as e:
             return False, [f"Error checking types: {str(e)}"]
 
+    def _analyze(self, content: bytes) -> Tuple[bool, List[str]]:
+        """Parse the source once and run every check in one traversal."""
+        tree = ast.parse(content)
+        visitor = _TypingVisitor()
+        for node in ast.walk(tree):
+            visitor.visit(node)
+
+        issues = []
+        if not visitor.has_typing_imports:
+            issues.append("Missing typing imports")
+        issues.extend(visitor.parameter_issues)
+
+        if visitor.function_count > 0:
+            typing_coverage = (
+                visitor.typed_functions / visitor.function_count
+            ) * 100
+            if typing_coverage < 80:
+                issues.append(
+                    f"Low typing coverage: {typing_coverage:.1f}% of "
+                    f"functions have return type annotations"
+                )
+
+        return len(issues) == 0, issues
+
+    def _cache_key(self, content: bytes) -> str:
+        """Key results by file content, checker version and Python version."""
+        digest = hashlib.sha256(content)
+        digest.update(
+            f"{self.VERSION}:{sys.version_info[0]}.{sys.version_info[1]}"
+            .encode()
+        )
+        return digest.hexdigest()
+
+    def _read_cache_file(self) -> Dict[str, Any]:
+        """Read the on-disk cache, treating any problem as an empty cache."""
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the on-disk cache once per checker."""
+        if self._cache is None:
+            self._cache = self._read_cache_file()
+        return self._cache
+
+    def _store(self, key: str, passed: bool, issues: List[str]) -> None:
+        """Record a result in memory until the next save()."""
+        self._load_cache()[key] = [passed, issues]
+        self._pending[key] = [passed, issues]
+
+    def save(self) -> None:
+        """Persist new results atomically, once per checker run."""
+        if self.cache_path is None or not self._pending:
+            return
+        try:
+            # Merge with entries written meanwhile by other processes
+            merged = self._read_cache_file()
+            merged.update(self._pending)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(merged, f)
+            os.replace(tmp_path, self.cache_path)
+            self._pending = {}
+        except OSError:
+            pass
+
+
+def _run_suite_worker(tester: "PolymorphismTester", method_name: str,
+                      conn: Connection) -> None:
+    """Run one test suite in a worker process and send back its result."""
+    tester.results = []
+    output = io.StringIO()
+    try:
+        with redirect_stdout(output):
+            getattr(tester, method_name)()
+        result = tester.results[-1]
+    except BaseException as e:
+        result = TestResult(method_name)
+        result.add_error(f"Test suite crashed: {str(e)}")
+    tester.type_checker.save()
+    conn.send((result, output.getvalue()))
+    conn.close()
+
 
 class PolymorphismTester:
     """Main testing class for polymorphic implementations with type checking."""
 
-    def __init__(self) -> None:
+    # (result name, suite method) for every exercise suite
+    SUITES: List[Tuple[str, str]] = [
+        ("Exercise 0: Data Processor Foundation", "_test_exercise_0"),
+        ("Exercise 1: Polymorphic Streams", "_test_exercise_1"),
+        ("Exercise 2: Nexus Integration", "_test_exercise_2"),
+    ]
+
+    # Timing-sensitive suites run one at a time after the exercise suites
+    # finish, so their budgets are not measured under competing CPU load.
+    EXCLUSIVE_SUITES: List[Tuple[str, str]] = [
+        ("Performance Budgets", "_test_performance"),
+        ("Memory Footprint", "_test_memory"),
+    ]
+
+    # Retained memory may grow at most this factor (plus slack bytes) when
+    # a workload processes 10x more items through the same object.
+    MEMORY_BUDGET: Dict[str, float] = {
+        "max_retained_growth": 2.0,
+        "slack_bytes": 64 * 1024,
+    }
+
+    # Per-target budgets: minimum throughput (items/s at the large input)
+    # and maximum time growth when the input grows 10x (10x is linear).
+    PERFORMANCE_BUDGETS: Dict[str, Dict[str, float]] = {
+        "NumericProcessor": {"min_throughput": 500_000, "max_scaling": 25.0},
+        "LogProcessor": {"min_throughput": 100_000, "max_scaling": 25.0},
+        "SensorStream": {"min_throughput": 100_000, "max_scaling": 25.0},
+        "ProcessingPipeline": {"min_throughput": 5_000, "max_scaling": 25.0},
+    }
+
+    def __init__(self, parallel: bool = True, timeout: float = 60.0,
+                 budgets: Optional[Dict[str, Dict[str, float]]] = None) -> None:
         self.results: List[TestResult] = []
         self.type_checker = TypeChecker()
+        self.parallel: bool = parallel
+        self.timeout: float = timeout
+        self.budgets: Dict[str, Dict[str, float]] = {
+            target: dict(budget)
+            for target, budget in self.PERFORMANCE_BUDGETS.items()
+        }
+        for target, budget in (budgets or {}).items():
+            self.budgets.setdefault(target, {}).update(budget)
 
     def load_module(self, file_path: str, module_name: str) -> Optional[Any]:
         """Dynamically load a Python module from file path."""
@@ -158,15 +299,64 @@ class PolymorphismTester:
         print()
 
         # Run individual test suites
-        self._test_exercise_0()
-        self._test_exercise_1()
-        self._test_exercise_2()
+        if self.parallel:
+            self._run_suites_parallel(self.SUITES)
+            for suite in self.EXCLUSIVE_SUITES:
+                self._run_suites_parallel([suite])
+        else:
+            for _, method_name in self.SUITES + self.EXCLUSIVE_SUITES:
+                getattr(self, method_name)()
+            self.type_checker.save()
 
         # Display summary
         self._display_summary()
 
         return all(result.passed for result in self.results)
 
+    def _run_suites_parallel(self, suites: List[Tuple[str, str]]) -> None:
+        """Run each suite in its own process, in parallel, with a timeout."""
+        workers = []
+        for name, method_name in suites:
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_run_suite_worker, args=(self, method_name, sender),
+                daemon=True
+            )
+            process.start()
+            sender.close()
+            workers.append((name, process, receiver))
+
+        deadline = time.monotonic() + self.timeout
+        for name, process, receiver in workers:
+            remaining = max(0.0, deadline - time.monotonic())
+            result: Optional[TestResult] = None
+            output = ""
+            try:
+                if receiver.poll(remaining):
+                    result, output = receiver.recv()
+            except EOFError:
+                pass
+            process.join(timeout=1.0)
+            timed_out = process.is_alive()
+            if timed_out:
+                process.terminate()
+                process.join()
+
+            if output:
+                print(output, end="")
+            if result is None:
+                result = TestResult(name)
+                if timed_out:
+                    result.add_error(f"Timed out after {self.timeout:.0f}s")
+                else:
+                    result.add_error(
+                        f"Test process exited with code {process.exitcode}"
+                    )
+                print(f"\n=== {name} ===")
+                print(f"✗ {result.errors[-1]}")
+            result.name = name
+            self.results.append(result)
+
     def _test_exercise_0(self) -> None:
         """Test Exercise 0: Data Processor Foundation with type checking."""
         result = TestResult("Exercise 0: Data Processor Foundation")
@@ -446,6 +636,251 @@ class PolymorphismTester:
 
         self.results.append(result)
 
+    def _measure(self, workload: Any, size: int, repeats: int = 3) -> float:
+        """Best-of-N wall time for running workload(size)."""
+        run = workload(size)
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def _check_budget(self, result: TestResult, target: str, workload: Any,
+                      size: int) -> None:
+        """Measure scaling from size to 10x size and compare to budgets."""
+        budget = self.budgets.get(target, {})
+        with redirect_stdout(io.StringIO()):
+            small = self._measure(workload, size)
+            large = self._measure(workload, size * 10)
+        scaling = large / small if small > 0 else 0.0
+        throughput = size * 10 / large if large > 0 else float("inf")
+
+        line = (f"{target}: {throughput:,.0f} items/s, "
+                f"10x input -> {scaling:.1f}x time")
+        failures = []
+        if throughput < budget.get("min_throughput", 0.0):
+            failures.append(
+                f"throughput below {budget['min_throughput']:,.0f} items/s"
+            )
+        if scaling > budget.get("max_scaling", float("inf")):
+            failures.append(
+                f"scaling above {budget['max_scaling']:.1f}x"
+            )
+        if failures:
+            result.add_error(f"{line} ({'; '.join(failures)})")
+            print(f"✗ {line}")
+        else:
+            print(f"✓ {line}")
+
+    def _test_performance(self) -> None:
+        """Test performance budgets on scaled inputs for every exercise."""
+        result = TestResult("Performance Budgets")
+
+        print("\n=== Testing Performance Budgets ===")
+
+        try:
+            quiet = io.StringIO()
+            with redirect_stdout(quiet):
+                stream_processor = self.load_module(
+                    "ex0/stream_processor.py", "stream_processor")
+                data_stream = self.load_module(
+                    "ex1/data_stream.py", "data_stream")
+                nexus_pipeline = self.load_module(
+                    "ex2/nexus_pipeline.py", "nexus_pipeline")
+            if not (stream_processor and data_stream and nexus_pipeline):
+                result.add_error("Could not load all exercise modules")
+            else:
+                # Keep stage tracing off the measured hot path
+                tracer = getattr(nexus_pipeline, "tracer", None)
+                if tracer is not None and hasattr(tracer, "set_level"):
+                    tracer.set_level(getattr(nexus_pipeline, "OFF", 100))
+
+                with redirect_stdout(quiet):
+                    numeric = stream_processor.NumericProcessor()
+                    log = stream_processor.LogProcessor()
+                    sensor = data_stream.SensorStream("SENSOR_PERF")
+                    pipeline = nexus_pipeline.JSONAdapter("PERF_001")
+                    pipeline.add_stage(nexus_pipeline.InputStage())
+                    pipeline.add_stage(nexus_pipeline.TransformStage())
+                    pipeline.add_stage(nexus_pipeline.OutputStage())
+
+                def numeric_workload(size: int) -> Any:
+                    values = list(range(size))
+                    return lambda: numeric.process(values)
+
+                def log_workload(size: int) -> Any:
+                    entries = [f"INFO: event {i} received"
+                               for i in range(size)]
+
+                    def run() -> None:
+                        for entry in entries:
+                            log.process(entry)
+                    return run
+
+                def sensor_workload(size: int) -> Any:
+                    batch = [f"temp:{20 + i % 15}.5" for i in range(size)]
+
+                    def run() -> None:
+                        sensor.process_batch(batch)
+                        sensor.get_stats()
+                    return run
+
+                def pipeline_workload(size: int) -> Any:
+                    record = '{"sensor": "temp", "value": 23.5, "unit": "C"}'
+
+                    def run() -> None:
+                        for _ in range(size):
+                            pipeline.process(record)
+                    return run
+
+                for target, workload, size in [
+                    ("NumericProcessor", numeric_workload, 100_000),
+                    ("LogProcessor", log_workload, 5_000),
+                    ("SensorStream", sensor_workload, 10_000),
+                    ("ProcessingPipeline", pipeline_workload, 500),
+                ]:
+                    self._check_budget(result, target, workload, size)
+                if not result.errors:
+                    result.mark_passed()
+
+        except Exception as e:
+            result.add_error(f"Unexpected error: {str(e)}")
+
+        if not result.passed:
+            print("✗ Performance budgets failed - check for superlinear "
+                  "processing")
+
+        self.results.append(result)
+
+    def _trace_memory(self, workload: Any, count: int) -> Tuple[int, int]:
+        """Return (peak, retained) bytes for running workload(count)."""
+        run = workload(count)
+        with redirect_stdout(io.StringIO()):
+            run()  # warm up lazily built state outside the measurement
+            gc.collect()
+            tracemalloc.start()
+            try:
+                base = tracemalloc.get_traced_memory()[0]
+                run()
+                gc.collect()
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        return peak - base, max(current - base, 0)
+
+    def _check_memory(self, result: TestResult, target: str, workload: Any,
+                      count: int) -> None:
+        """Check that retained memory stays bounded as the input grows."""
+        small_peak, small_retained = self._trace_memory(workload, count)
+        large_peak, large_retained = self._trace_memory(workload, count * 10)
+        limit = (small_retained * self.MEMORY_BUDGET["max_retained_growth"]
+                 + self.MEMORY_BUDGET["slack_bytes"])
+
+        line = (f"{target}: peak {small_peak / 1024:.1f} KiB -> "
+                f"{large_peak / 1024:.1f} KiB, retained "
+                f"{small_retained / 1024:.1f} KiB -> "
+                f"{large_retained / 1024:.1f} KiB")
+        if large_retained > limit:
+            result.add_error(f"{line} (retention grows with input size)")
+            print(f"✗ {line}")
+        else:
+            print(f"✓ {line}")
+
+    def _test_memory(self) -> None:
+        """Test that long-running objects do not retain processed data."""
+        result = TestResult("Memory Footprint")
+
+        print("\n=== Testing Memory Footprint ===")
+
+        try:
+            with redirect_stdout(io.StringIO()):
+                stream_processor = self.load_module(
+                    "ex0/stream_processor.py", "stream_processor")
+                data_stream = self.load_module(
+                    "ex1/data_stream.py", "data_stream")
+                nexus_pipeline = self.load_module(
+                    "ex2/nexus_pipeline.py", "nexus_pipeline")
+            if not (stream_processor and data_stream and nexus_pipeline):
+                result.add_error("Could not load all exercise modules")
+            else:
+                tracer = getattr(nexus_pipeline, "tracer", None)
+                if tracer is not None and hasattr(tracer, "set_level"):
+                    tracer.set_level(getattr(nexus_pipeline, "OFF", 100))
+
+                def processor_workload(cls: Any, make: Any) -> Any:
+                    def workload(count: int) -> Any:
+                        with redirect_stdout(io.StringIO()):
+                            processor = cls()
+
+                        def run() -> None:
+                            for i in range(count):
+                                processor.process(make(i))
+                        return run
+                    return workload
+
+                def stream_workload(cls: Any, make: Any) -> Any:
+                    def workload(count: int) -> Any:
+                        with redirect_stdout(io.StringIO()):
+                            stream = cls("MEM_001")
+
+                        def run() -> None:
+                            for i in range(count):
+                                stream.process_batch(
+                                    [make(i, j) for j in range(50)]
+                                )
+                                stream.get_stats()
+                        return run
+                    return workload
+
+                def pipeline_workload(count: int) -> Any:
+                    with redirect_stdout(io.StringIO()):
+                        pipeline = nexus_pipeline.JSONAdapter("MEM_001")
+                        pipeline.add_stage(nexus_pipeline.InputStage())
+                        pipeline.add_stage(nexus_pipeline.TransformStage())
+                        pipeline.add_stage(nexus_pipeline.OutputStage())
+                    formats = [
+                        lambda i: f'{{"sensor": "temp", "value": {i % 40}}}',
+                        lambda i: f"user,action\nuser_{i},login",
+                        lambda i: [float(i), 1.5, 2.5],
+                    ]
+
+                    def run() -> None:
+                        for i in range(count):
+                            pipeline.process(formats[i % 3](i))
+                    return run
+
+                for target, workload, count in [
+                    ("NumericProcessor", processor_workload(
+                        stream_processor.NumericProcessor,
+                        lambda i: [i, i + 1, i + 2]), 1_000),
+                    ("LogProcessor", processor_workload(
+                        stream_processor.LogProcessor,
+                        lambda i: f"ERROR: event {i}"), 1_000),
+                    ("SensorStream", stream_workload(
+                        data_stream.SensorStream,
+                        lambda i, j: f"temp:{(i + j) % 40}.5"), 20),
+                    ("TransactionStream", stream_workload(
+                        data_stream.TransactionStream,
+                        lambda i, j: f"buy:{i + j}"), 20),
+                    ("EventStream", stream_workload(
+                        data_stream.EventStream,
+                        lambda i, j: f"event_{i + j}"), 20),
+                    ("ProcessingPipeline", pipeline_workload, 300),
+                ]:
+                    self._check_memory(result, target, workload, count)
+                if not result.errors:
+                    result.mark_passed()
+
+        except Exception as e:
+            result.add_error(f"Unexpected error: {str(e)}")
+
+        if not result.passed:
+            print("✗ Memory footprint checks failed - check for objects "
+                  "retaining processed data")
+
+        self.results.append(result)
+
     def _display_summary(self) -> None:
         """Display comprehensive test summary."""
         print("\n" + "=" * 60)
@@ -498,6 +933,14 @@ Description:
     - Polymorphic behavior using abstract base classes (ABC)
     - Comprehensive type annotations throughout all code
     - Correct implementation of required classes and methods
+    - Performance budgets: throughput and near-linear scaling on
+      10x larger inputs
+    - Memory footprint: retained memory stays bounded on 10x larger
+      workloads (measured with tracemalloc)
+
+    Each exercise suite runs in its own process, in parallel, so a slow
+    or hanging module only fails its own exercise (timeout: 60s). The
+    performance and memory suites then run one at a time on their own.
 
 Requirements:
     - Python 3.10 or later